@@ -45,6 +45,13 @@ class AimlessShootingDriver:
         An acceptor that implements an `is_accepted` method to determine if a
         shooting point should be considered accepted or not. Deep copied and
         used as a template for all parallel shootings.
+    rng
+        Source of randomness for picking offsets and states, shared by all
+        parallel shootings. If None, the global `random` module is used.
+    np_rng
+        Numpy random generator (e.g. from ``np.random.default_rng``) used for
+        velocity generation and picking starting points, shared by all parallel
+        shootings. If None, the global ``np.random`` state is used.
 
     Attributes
     ----------
@@ -58,15 +65,22 @@ class AimlessShootingDriver:
         Root name for all logging
     base_acceptor : AbstractAcceptor
         Acceptor template to be used for all shootings
+    rng : random.Random
+        Source of randomness passed to all shootings
+    np_rng : np.random.Generator
+        Numpy random generator passed to all shootings
     """
 
     def __init__(self, engine: AbstractEngine, position_dir: str, temp: float,
-                 log_name: str, acceptor: AbstractAcceptor = None):
+                 log_name: str, acceptor: AbstractAcceptor = None,
+                 rng: random.Random = None, np_rng: np.random.Generator = None):
         self.base_engine = engine
         self.position_dir = position_dir
         self.temp = temp
         self.base_acceptor = acceptor
         self.log_name = log_name
+        self.rng = rng
+        self.np_rng = np_rng
 
     def run(self, n_parallel: int, **run_args) -> None:
         """Run multiple AimlessShootings in parallel.
@@ -116,7 +130,8 @@ class AimlessShootingDriver:
 
             results_logger = ResultsLogger(f"{self.log_name}{i}", base_results_logger)
             algo = AsyncAimlessShooting(engine, self.position_dir, self.temp,
-                                        results_logger, acceptor, logger)
+                                        results_logger, acceptor, logger,
+                                        self.rng, self.np_rng)
 
             tasks.append(asyncio.create_task(algo.run(**run_args)))
 
@@ -147,6 +162,15 @@ class AsyncAimlessShooting:
         shooting point should be considered accepted or not. If None, the
         DefaultAcceptor is used, which accepts if both trajectories commit to
         different basins.
+    logger
+        Logger for progress messages. If None, the module logger is used.
+    rng
+        Source of randomness for picking offsets and states. If None, the global
+        `random` module is used.
+    np_rng
+        Numpy random generator (e.g. from ``np.random.default_rng``) used for
+        velocity generation and picking starting points. If None, the global
+        ``np.random`` state is used.
 
     Attributes
     ----------
@@ -169,11 +193,16 @@ class AsyncAimlessShooting:
     acceptor : AbstractAcceptor
         An acceptor that implements an `is_accepted` method to determine if a
         shooting point should be considered accepted or not.
+    rng : random.Random
+        Source of randomness for picking offsets and states
+    np_rng : np.random.Generator
+        Numpy random generator for velocities and starting points
     """
 
     def __init__(self, engine: AbstractEngine, position_dir: str, temp: float,
                  results_logger: ResultsLogger, acceptor: AbstractAcceptor = None,
-                 logger: logging.Logger = None):
+                 logger: logging.Logger = None, rng: random.Random = None,
+                 np_rng: np.random.Generator = None):
         if logger is None:
             self.logger = module_logger
         else:
@@ -188,7 +217,11 @@ class AsyncAimlessShooting:
         if self.acceptor is None:
             self.acceptor = DefaultAcceptor()
 
-        self.current_offset = random.choice([-1, 0, 1])
+        # Fall back on the global random states, which expose the same methods
+        self.rng = random if rng is None else rng
+        self.np_rng = np.random if np_rng is None else np_rng
+
+        self.current_offset = self.rng.choice([-1, 0, 1])
         self.current_start = None
 
         self.accepted_states = []
@@ -242,7 +275,7 @@ class AsyncAimlessShooting:
                 raise RuntimeError("No initial guesses were accepted as "
                                    "transition states")
 
-        self.current_start = random.choice(self.accepted_states)
+        self.current_start = self.rng.choice(self.accepted_states)
 
         while accepted_states < n_points:
             self.logger.debug("Offset of this position: %s", self.current_offset)
@@ -266,7 +299,7 @@ class AsyncAimlessShooting:
                                       n_state_tries, n_vel_tries, n_state_tries * n_vel_tries)
 
                 # randomly choose a new start from the list that we know works
-                self.current_start = random.choice(self.accepted_states)
+                self.current_start = self.rng.choice(self.accepted_states)
 
             else:
                 # Our starting position is accepted with result. It has been
@@ -281,7 +314,7 @@ class AsyncAimlessShooting:
                 states_since_success = 0
 
             # No matter what, we should pick a new offset to remain stochastic
-            self.current_offset = random.choice([-1, 0, 1])
+            self.current_offset = self.rng.choice([-1, 0, 1])
 
     async def _kickstart(self, n_vel_tries: int) -> bool:
         """Loop through provided initial guesses to see if any are accepted.
@@ -379,7 +412,8 @@ class AsyncAimlessShooting:
         """
         for i in range(n_attempts):
             # Generate new velocities, run one point from it
-            vels = generate_velocities(self.engine.atoms, self.temp)
+            vels = generate_velocities(self.engine.atoms, self.temp,
+                                       self.np_rng)
             # Set the position
             self.engine.set_positions(self.current_start)
             result = await self._run_one_velocity(vels)
@@ -466,7 +500,7 @@ class AsyncAimlessShooting:
         # If the current offset is 0, we want to choose between the middle 3. If
         # its -1, we need to choose from the upper 3, and if its +1, the lower.
         indices = np.array([1, 2, 3]) - self.current_offset
-        chosen_index = np.random.choice(indices)
+        chosen_index = self.np_rng.choice(indices)
 
         # subtract 2 to print out one of [-2, -1, 0, +1, +2]
         self.logger.debug("Next chosen point: %s (current offset: %s)",
@@ -605,7 +639,8 @@ class ResultsLogger:
                 self.cur_index = 0
 
 
-def generate_velocities(atoms: Sequence[str], temp: float) -> np.array:
+def generate_velocities(atoms: Sequence[str], temp: float,
+                        np_rng: np.random.Generator = None) -> np.array:
     """Generates velocities for atoms in m/s at a temp. from MB distribution
 
     Parameters
@@ -615,14 +650,48 @@ def generate_velocities(atoms: Sequence[str], temp: float) -> np.array:
         table format (e.g. Ar = Argon).
     temp
         Temperature in Kelvin
+    np_rng
+        Numpy random generator to draw from. If None, the global ``np.random``
+        state is used.
 
     Returns
     -------
     An array of velocities in m/s generated randomly from the Maxwell-Boltzmann
     distribution. Has the shape (n_atoms, 3), where 3 is the x,y,z directions.
     """
+    return generate_velocities_batch(atoms, temp, 1, np_rng)[0]
+
+
+def generate_velocities_batch(atoms: Sequence[str], temp: float, n_samples: int,
+                              np_rng: np.random.Generator = None) -> np.array:
+    """Generates several independent sets of velocities at once.
+
+    Each set is drawn, shifted to zero momentum and scaled to `temp` exactly as
+    in `generate_velocities`, but all sets are drawn and processed together.
+
+    Parameters
+    ----------
+    atoms
+        A list of the atoms to generate velocities for. Strings in periodic
+        table format (e.g. Ar = Argon).
+    temp
+        Temperature in Kelvin
+    n_samples
+        Number of velocity sets to generate
+    np_rng
+        Numpy random generator to draw from. If None, the global ``np.random``
+        state is used.
+
+    Returns
+    -------
+    An array of velocities in m/s generated randomly from the Maxwell-Boltzmann
+    distribution. Has the shape (n_samples, n_atoms, 3).
+    """
     kB = 1.380649e-23  # J / K
 
+    if np_rng is None:
+        np_rng = np.random
+
     mass = atomic_symbols_to_mass(atoms)
     n_atoms = len(mass)
 
@@ -635,17 +704,17 @@ def generate_velocities(atoms: Sequence[str], temp: float) -> np.array:
     # Convert mass from amu to kg
     mass = np.asarray(mass).reshape(-1, 1) / 1000 / 6.022e23
 
-    v_raw = np.sqrt(kB * temp / mass) * np.random.normal(size=(n_atoms, 3))
+    v_raw = np.sqrt(kB * temp / mass) * np_rng.normal(size=(n_samples, n_atoms, 3))
 
     # Shift velocities by mean momentum such that total
     # box momentum is 0 in all dimensions.
-    p_mean = np.sum(mass * v_raw, axis=0) / n_atoms
+    p_mean = np.sum(mass * v_raw, axis=1, keepdims=True) / n_atoms
     v_mean = p_mean / mass.mean()
     v_shifted = v_raw - v_mean
 
     # Scale velocities to exact target temperature.
     # Prevents systems with few atoms from sampling far away from target T.
-    temp_shifted = np.sum(mass * v_shifted ** 2) / (dof * kB)
+    temp_shifted = np.sum(mass * v_shifted ** 2, axis=(1, 2), keepdims=True) / (dof * kB)
     scale = np.sqrt(temp / temp_shifted)
     v_scaled = v_shifted * scale
 
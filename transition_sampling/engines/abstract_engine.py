@@ -5,11 +5,9 @@ order to be used by the aimless shooting algorithm
 from __future__ import annotations
 
 import asyncio
-import glob
 import logging
 import numbers
 import os
-import re
 import subprocess
 import uuid
 from abc import ABC, abstractmethod
@@ -120,7 +118,7 @@ class AbstractEngine(ABC):
         working directory is not a real directory.
     """
 
-    ARG_SUB = r"%CMD_ARGS%"
+    ARG_SUB = "%CMD_ARGS%"
 
     @abstractmethod
     def __init__(self, inputs: dict, working_dir: str = None,
@@ -156,7 +154,7 @@ class AbstractEngine(ABC):
 
         # Split command into a list of args
         self.md_cmd = inputs["md_cmd"]
-        if self.md_cmd.find(self.ARG_SUB) == -1:
+        if self.ARG_SUB not in self.md_cmd:
             self.md_cmd = self.md_cmd.split()
 
         # Create the plumed handler for the give plumed file
@@ -216,7 +214,7 @@ class AbstractEngine(ABC):
         ValueError
             If the array does not match the required specifications
         """
-        if positions.shape[0] != len(self.atoms):
+        if positions.ndim != 2 or positions.shape[0] != len(self.atoms):
             raise ValueError("There must be one position for every atom")
 
         if positions.shape[1] != 3:
@@ -242,7 +240,7 @@ class AbstractEngine(ABC):
         ValueError
             If the array does not match the required specifications
         """
-        if velocities.shape[0] != len(self.atoms):
+        if velocities.ndim != 2 or velocities.shape[0] != len(self.atoms):
             raise ValueError("There must be one velocity for every atom")
 
         if velocities.shape[1] != 3:
@@ -358,8 +356,11 @@ class AbstractEngine(ABC):
         # Plumed cannot support more than 100 backups. Remove them if they are
         # present in the working directory
         # TODO May be a way to turn them off
-        for plumed_backup in glob.glob(f"{self.working_dir}/bck.*.PLUMED.OUT"):
-            os.remove(plumed_backup)
+        with os.scandir(self.working_dir) as entries:
+            for entry in entries:
+                if (entry.name.startswith("bck.")
+                        and entry.name.endswith(".PLUMED.OUT")):
+                    os.unlink(entry.path)
 
         # random project name so we don't overwrite/append anything
         proj_name = uuid.uuid4().hex
@@ -401,7 +402,7 @@ class AbstractEngine(ABC):
         return await self._launch_traj(projname + "_rev")
 
     async def _open_md_and_wait(self, argument_list: list,
-                                projname: str) -> subprocess.Popen:
+                                projname: str) -> subprocess.CompletedProcess:
         """
         Add the passed arguments to the md_cmd, open in a new process, and wait
 
@@ -423,11 +424,12 @@ class AbstractEngine(ABC):
 
         Returns
         -------
-        The resulting subprocess.Popen after it has been completed. If this
-        function is awaited, it will block until the opened process finishes.
+        The completed process, holding its return code and captured stdout and
+        stderr. If this function is awaited, it will block until the opened
+        process finishes.
         """
         if isinstance(self.md_cmd, str):
-            command = re.sub(self.ARG_SUB, ' '.join(argument_list), self.md_cmd)
+            command = self.md_cmd.replace(self.ARG_SUB, ' '.join(argument_list))
             as_shell = True
         else:
             command = self.md_cmd + argument_list
@@ -435,17 +437,23 @@ class AbstractEngine(ABC):
 
         self.logger.debug("Launching trajectory %s %sin shell mode with command %s",
                           projname, "" if as_shell else "not ", command)
-        proc = subprocess.Popen(command, cwd=self.working_dir, shell=as_shell,
-                                stderr=subprocess.PIPE,
-                                stdout=subprocess.PIPE)
+        if as_shell:
+            proc = await asyncio.create_subprocess_shell(
+                command, cwd=self.working_dir, stderr=subprocess.PIPE,
+                stdout=subprocess.PIPE)
+        else:
+            proc = await asyncio.create_subprocess_exec(
+                *command, cwd=self.working_dir, stderr=subprocess.PIPE,
+                stdout=subprocess.PIPE)
 
-        # Wait for it to finish
-        while proc.poll() is None:
-            # Non-blocking sleep
-            await asyncio.sleep(1)
+        # Wait for it to finish without blocking the event loop. Reading the
+        # pipes while waiting also stops a chatty process from filling them and
+        # stalling
+        stdout, stderr = await proc.communicate()
 
         # now complete
-        return proc
+        return subprocess.CompletedProcess(command, proc.returncode, stdout,
+                                           stderr)
 
     @abstractmethod
     async def _launch_traj(self, projname: str) -> dict:
@@ -10,9 +10,9 @@ import subprocess
 from typing import Sequence
 
 import numpy as np
-from cp2k_input_tools.parser import CP2KInputParser
 
 from . import CP2KInputsHandler, CP2KOutputHandler
+from .CP2K_inputs import parse_cp2k_inputs
 from .. import AbstractEngine, ShootingResult
 from ..plumed import PlumedOutputHandler
 
@@ -29,9 +29,9 @@ class CP2KEngine(AbstractEngine):
         In addition to the inputs required by AbstractEngine, CP2KEngine also
         requires
 
-        - cp2k_inputs : str
-            The path to the CP2K inputs file to use for the simulations. This
-            file will not be modified
+        - cp2k_inputs : str | IO
+            The path to the CP2K inputs file to use for the simulations, or an
+            open text file with its contents. This file will not be modified
 
     Attributes
     ----------
@@ -84,9 +84,10 @@ class CP2KEngine(AbstractEngine):
         # Validate the CP2K input file. Parser will throw exceptions if invalid
         # TODO: More specific error handling for .inp file
         try:
-            with open(inputs["cp2k_inputs"]) as f:
-                parser = CP2KInputParser()
-                parser.parse(f)
+            parse_cp2k_inputs(inputs["cp2k_inputs"])
+            if not isinstance(inputs["cp2k_inputs"], (str, os.PathLike)):
+                # Rewind so the inputs handler can parse it again
+                inputs["cp2k_inputs"].seek(0)
         except Exception as e:
             return False, f"cp2k_inputs: {str(e)}"
 
@@ -166,15 +167,13 @@ class CP2KEngine(AbstractEngine):
         # Check if there was a fatal error that wasn't caused by a committing
         # basin
         if proc.returncode != 0 and not os.path.isfile(plumed_out_path):
-            stdout, stderr = proc.communicate()
-
             # Copy the output file to a place we can see it
             # TODO copy more info (pos)
             output_file = f"{projname}_FATAL.out"
             output_handler.copy_out_file(output_file)
 
-            stdout_msg = stdout.decode('ascii')
-            stderror_msg = stderr.decode('ascii')
+            stdout_msg = proc.stdout.decode('ascii')
+            stderror_msg = proc.stderr.decode('ascii')
 
             # Append the error from stdout to the output file
             with open(output_file, "a") as f:
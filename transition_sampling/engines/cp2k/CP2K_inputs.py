@@ -1,12 +1,46 @@
 from __future__ import annotations
 
+import functools
 import logging
+import os
+import typing
 
 import numpy as np
 from cp2k_input_tools.generator import CP2KInputGenerator
 from cp2k_input_tools.parser import CP2KInputParser
 
 
+@functools.lru_cache(maxsize=1)
+def _get_parser() -> CP2KInputParser:
+    """Get the shared CP2K input parser.
+
+    Constructing the parser loads the full CP2K XML specification, which costs
+    far more than parsing an input, so one instance is built and reused.
+    """
+    return CP2KInputParser()
+
+
+def parse_cp2k_inputs(cp2k_inputs_file: typing.Union[str, os.PathLike,
+                                                     typing.IO]) -> dict:
+    """Parse a CP2K inputs file into its nested dictionary representation.
+
+    Parameters
+    ----------
+    cp2k_inputs_file
+        Path to the CP2K inputs file, or an open text file positioned at the
+        start of the inputs
+
+    Returns
+    -------
+    The nested dictionary representing the inputs, as given by cp2k-input-tools
+    """
+    if isinstance(cp2k_inputs_file, (str, os.PathLike)):
+        with open(cp2k_inputs_file) as f:
+            return _get_parser().parse(f)
+
+    return _get_parser().parse(cp2k_inputs_file)
+
+
 class CP2KInputsHandler:
     """Handles manipulating the raw CP2K Inputs data structure.
 
@@ -18,7 +52,8 @@ class CP2KInputsHandler:
     Parameters
     ----------
     cp2k_inputs_file
-        The cp2k inputs file that serves as a template for this class
+        The cp2k inputs file that serves as a template for this class. Either a
+        path or an open text file positioned at the start of the inputs.
 
     Attributes
     ----------
@@ -26,15 +61,15 @@ class CP2KInputsHandler:
         The in-memory data structure representing the current inputs
     """
 
-    def __init__(self, cp2k_inputs_file: str, logger: logging.Logger = None):
+    def __init__(self,
+                 cp2k_inputs_file: typing.Union[str, os.PathLike, typing.IO],
+                 logger: logging.Logger = None):
         if logger is None:
             self.logger = logging.getLogger(__name__)
         else:
             self.logger = logger
 
-        with open(cp2k_inputs_file) as f:
-            parser = CP2KInputParser()
-            self.cp2k_dict = parser.parse(f)
+        self.cp2k_dict = parse_cp2k_inputs(cp2k_inputs_file)
 
         self._atoms = None
         self._init_free_energy_section()
@@ -92,10 +127,10 @@ class CP2KInputsHandler:
         # coords stored as list of "El x y z" strings, same as CP2K .inp file
         coords = self._get_coord()
 
-        for i in range(positions.shape[0]):
-            # Create the space separated string and append it to the atom
-            pos_str = ' '.join([str(p) for p in positions[i, :]])
-            coords[i] = f"{self.atoms[i]} {pos_str}"
+        # Convert the whole array to Python floats at once, whose str is the
+        # shortest representation that still round trips exactly
+        coords[:] = [f"{atom} {x} {y} {z}"
+                     for atom, (x, y, z) in zip(self.atoms, positions.tolist())]
 
     def set_velocities(self, velocities: np.ndarray) -> None:
         """Set the velocities in au of atoms in the inputs.
@@ -110,18 +145,14 @@ class CP2KInputsHandler:
         """
         vel = self._get_velocity()
 
-        # Assign all the velocities
-        for i in range(velocities.shape[0]):
-            # yeah, im gonna type it out so the typing system doesn't complain
-            vel[i] = (velocities[i, 0], velocities[i, 1], velocities[i, 2])
+        # Assign all the velocities, replacing the contents of the stored list
+        vel[:] = [(x, y, z) for x, y, z in velocities.tolist()]
 
     def flip_velocity(self) -> None:
         """Modify state by multiplying every velocity component by -1
         """
         vel = self._get_velocity()
-        for i in range(len(vel)):
-            # AND I'D DO IT AGAIN!
-            vel[i] = (-1 * vel[i][0], -1 * vel[i][1], -1 * vel[i][2])
+        vel[:] = [(-x, -y, -z) for x, y, z in vel]
 
     def set_project_name(self, projname: str) -> None:
         """Set the CP2K project name of the inputs
@@ -189,7 +220,8 @@ class CP2KInputsHandler:
         # fs
         return self.cp2k_dict["+motion"]["+md"]["timestep"]
 
-    def write_cp2k_inputs(self, filename: str) -> None:
+    def write_cp2k_inputs(self, filename: typing.Union[str, os.PathLike,
+                                                       typing.IO]) -> None:
         """Write the current state of the inputs to the passed file name.
 
         Creates the standard cp2k input format. Overwrites anything present.
@@ -197,12 +229,18 @@ class CP2KInputsHandler:
         Parameters
         ----------
         filename
-            The file to write the input to
+            The file to write the input to, or an open text file to write it
+            into at its current position
         """
-        with open(filename, 'w') as f:
-            cp2k_gen = CP2KInputGenerator()
-            for line in cp2k_gen.line_iter(self.cp2k_dict):
-                f.write(f"{line}\n")
+        if isinstance(filename, (str, os.PathLike)):
+            with open(filename, 'w') as f:
+                self.write_cp2k_inputs(f)
+            return
+
+        # Build the whole input deck in memory and hand it over in one write
+        cp2k_gen = CP2KInputGenerator()
+        lines = cp2k_gen.line_iter(self.cp2k_dict)
+        filename.write("".join(f"{line}\n" for line in lines))
 
     def _get_subsys(self) -> dict:
         """Gets the subsys section of the stored cp2k inputs
@@ -23,25 +23,31 @@ class CP2KOutputHandler:
         """
         self.name = name
         self.working_dir = working_dir
+        self._warnings = None
 
     def check_warnings(self) -> Sequence:
         """Check the output file for any warnings.
 
-        Returns a list of warnings. The list is empty if there are none.
+        Returns a list of warnings. The list is empty if there are none. The
+        output file is only scanned on the first call, since it is complete
+        once CP2K has exited.
 
         Returns
         -------
         A list of warnings from this output file
         """
-        with open(self.get_out_file(), "r") as f:
-            warnings = match_warnings(f.read())
-
-        # cp2k-output-tools >= v0.4.0
-        # if an early version of cp2k-output-tools is installed by mistake,
-        # remove the .data
-        # remove warnings about truncation for paths that are too long
-        return [warn for warn in warnings.data['warnings']
-                if "val_get will truncate" not in warn["message"]]
+        if self._warnings is None:
+            with open(self.get_out_file(), "r") as f:
+                warnings = match_warnings(f.read())
+
+            # cp2k-output-tools >= v0.4.0
+            # if an early version of cp2k-output-tools is installed by mistake,
+            # remove the .data
+            # remove warnings about truncation for paths that are too long
+            self._warnings = [warn for warn in warnings.data['warnings']
+                              if "val_get will truncate" not in warn["message"]]
+
+        return self._warnings
 
     def get_out_file(self) -> str:
         """Get the full name of the output file
@@ -124,19 +124,18 @@ class GromacsEngine(AbstractEngine):
         # Check velocities are valid by passing to base class
         super().set_velocities(velocities)
 
-        # convert from m/s to gromacs km/s (nm/ps)
-        velocities /= 1000
+        # convert from m/s to gromacs km/s (nm/ps). Out of place so the
+        # caller's array is left untouched
+        velocities = velocities / 1000
         self.gro_struct.velocities = velocities
 
     def validate_inputs(self, inputs: dict) -> (bool, str):
-        if "mdp_file" not in inputs:
-            return False, "mdp_file required for gromacs"
+        for file in ("mdp_file", "gro_file", "top_file"):
+            if file not in inputs:
+                return False, f"{file} required for gromacs"
 
-        if "gro_file" not in inputs:
-            return False, "gro_file required for gromacs"
-
-        if "top_file" not in inputs:
-            return False, "top_file required for gromacs"
+            if not os.path.isfile(inputs[file]):
+                return False, f"{file} must be a valid file"
 
         if "grompp_cmd" not in inputs:
             return False, "grompp_cmd required for gromacs"
@@ -189,17 +188,14 @@ class GromacsEngine(AbstractEngine):
                         gro_path, "-p", top_path, "-o", tpr_path]
         self.logger.debug("grompp-ing trajectory %s with command %s", projname,
                           command_list)
-        grompp_proc = subprocess.Popen(command_list, cwd=self.working_dir,
-                                       stderr=subprocess.PIPE,
-                                       stdout=subprocess.PIPE)
+        grompp_proc = await asyncio.create_subprocess_exec(
+            *command_list, cwd=self.working_dir, stderr=subprocess.PIPE,
+            stdout=subprocess.PIPE)
 
         # Wait for it to finish
-        while grompp_proc.poll() is None:
-            # Non-blocking sleep
-            await asyncio.sleep(0.1)
+        stdout, stderr = await grompp_proc.communicate()
 
         if grompp_proc.returncode != 0:
-            stdout, stderr = grompp_proc.communicate()
             stdout_msg = stdout.decode('ascii')
             stderror_msg = stderr.decode('ascii')
             self.logger.error("Trajectory %s exited fatally when grompp-ing:\n"
@@ -264,9 +260,8 @@ class GromacsEngine(AbstractEngine):
         # Check if there was a fatal error that wasn't caused by a committing
         # basin
         if proc.returncode != 0:
-            stdout, stderr = proc.communicate()
-            stdout_msg = stdout.decode('ascii')
-            stderror_msg = stderr.decode('ascii')
+            stdout_msg = proc.stdout.decode('ascii')
+            stderror_msg = proc.stderr.decode('ascii')
 
             # Copy the output file to a place we can see it
             failed_log = os.path.join(self.working_dir, f"{projname}.log")
@@ -4,8 +4,26 @@ used during the shooting point generation.
 """
 from __future__ import annotations
 
+import mmap
 import os
 import re
+import typing
+
+# regex to match the start of the committor section. This is where we will
+# insert the FILE arg. Handle the optional ... block format allowed by PLUMED.
+# If \2 matches, we know is format was used. The first section is to state that
+# COMMITTOR must be the first non-horizontal whitespace in a line, thus ignoring
+# any lines that have preceding characters (such as comments) and ignoring
+# multi-line breaks that \s matches.
+_COMMITTOR_PATTERN = re.compile(r"^[^\S\r\n]*(COMMITTOR (\.\.\.\s*\n)?)",
+                                re.MULTILINE)
+
+# Plumed output has this line followed by the basin number.
+# In all plumed versions 2.6.x and earlier this has been a typo "COMMITED".
+# However it looks like 2.7 has a patch for this, so we will keep an extra
+# optional 'T' here to match both versions. Bytes so it can run directly over a
+# memory mapped output file.
+_BASIN_PATTERN = re.compile(rb"SET COMMITT?ED TO BASIN (?P<basin>\d+)")
 
 
 class PlumedInputHandler:
@@ -37,18 +55,22 @@ class PlumedInputHandler:
         If `plumed_file` is not a file.
     """
     def __init__(self, plumed_file: str):
-        if not os.path.isfile(plumed_file):
-            raise ValueError("plumed file must a valid file")
-
         # TODO: more validation - ensure that no-stop is false
 
-        with open(plumed_file) as f:
-            # Save the entire string in memory so we can modify repeatedly
-            plumed_in_str = f.read()
+        # Opening the file is its own existence check, so no separate stat is
+        # needed before it
+        try:
+            with open(plumed_file) as f:
+                # Save the entire string in memory so we can modify repeatedly
+                plumed_in_str = f.read()
+        except OSError as e:
+            raise ValueError("plumed file must a valid file") from e
 
         self.before, self.after = self._split_file(plumed_in_str)
 
-    def write_plumed(self, new_location: str, out_name: str) -> None:
+    def write_plumed(self,
+                     new_location: typing.Union[str, os.PathLike, typing.IO],
+                     out_name: str) -> None:
         """Copy the plumed file and set the committor output file.
 
         The plumed file is object is tied to is copied to `new_location`.
@@ -57,14 +79,17 @@ class PlumedInputHandler:
         Parameters
         ----------
         new_location
-            Location to copy the plumed file to
+            Path to copy the plumed file to, or an open text file to write it
+            into at its current position
         out_name
             Name to be set for the COMMITTOR out file
         """
-        with open(new_location, "w") as f:
-            f.write(self.before)
-            f.write(f"FILE={out_name}")
-            f.write(self.after)
+        if isinstance(new_location, (str, os.PathLike)):
+            with open(new_location, "w") as f:
+                self.write_plumed(f, out_name)
+            return
+
+        new_location.write(f"{self.before}FILE={out_name}{self.after}")
 
     @staticmethod
     def _split_file(raw_str: str) -> tuple[str, str]:
@@ -89,18 +114,9 @@ class PlumedInputHandler:
         before, after = _split_file(plumed_string)
         inserted_arg = before + "FILE=myfile" + after
         """
-        # regex to match the start of the committor section. This is where
-        # we will insert the FILE arg. Handle the optional ... block format
-        # allowed by PLUMED. If \2 matches, we know is format was used.
-        # The first section is to state that COMMITTOR must be the first
-        # non-horizontal whitespace in a line, thus ignoring any lines that have
-        # preceding characters (such as comments) and ignoring multi-line breaks
-        # that \s matches.
-        pattern = re.compile(r"^[^\S\r\n]*(COMMITTOR (\.\.\.\s*\n)?)", re.MULTILINE)
-
         # Match is a list of all the matching patterns. Each entry is a tuple,
         # with one entry for each group
-        match = pattern.findall(raw_str)
+        match = _COMMITTOR_PATTERN.findall(raw_str)
         if len(match) == 0:
             raise ValueError("COMMITTOR section was not found")
 
@@ -109,7 +125,7 @@ class PlumedInputHandler:
 
         # We are guaranteed for `before` to be formatted correctly for insertion
         # due to the regex including a trailing space or new line, but may
-        split = pattern.split(raw_str)
+        split = _COMMITTOR_PATTERN.split(raw_str)
 
         # Set to set the 2nd matched group to be "" to avoid repeat with 1st
         # group when joined
@@ -154,22 +170,29 @@ class PlumedOutputHandler:
         Read the basin of the attached plumed committor output.
 
         Looks at the plumed output file that this object was created with and
-        returns the basin it committed to.
+        returns the basin it committed to. PLUMED writes the committing line
+        last, so the file is searched backwards and, if there is more than one
+        committing line, the last one is used.
 
         Returns
         -------
         The basin the attached plumed file committed to. None if did not commit.
         """
-        # Plumed output has this line followed by the basin number.
-
-        # In all plumed versions 2.6.x and earlier this has been a typo
-        # "COMMITED". However it looks like 2.7 has a patch for this,
-        # so we will keep an extra optional 'T' here to match both versions.
-        pattern = re.compile(r"SET COMMITT?ED TO BASIN (?P<basin>\d+)")
-        with open(self.plumed_out_file) as f:
-            match = pattern.search(f.read())
-
-        if not match:
-            return None
-        else:
-            return int(match.group("basin"))
+        with open(self.plumed_out_file, "rb") as f:
+            # mmap cannot map an empty file, which is what an uncommitted
+            # trajectory leaves behind
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # The committing line is written last, so search back from the
+                # end rather than reading the whole file. Occurrences that
+                # aren't a complete committing line are skipped.
+                start = mm.rfind(b"SET COMMIT")
+                while start != -1:
+                    match = _BASIN_PATTERN.match(mm, start)
+                    if match:
+                        return int(match.group("basin"))
+                    start = mm.rfind(b"SET COMMIT", 0, start)
+
+                return None
@@ -72,6 +72,11 @@ def optimize(colvars: np.ndarray, is_accepted: np.ndarray,
     # because basin hopping will make its own after one iteration.
     x0 = np.random.random_sample(n_parameters)
 
+    # obj_func only ever multiplies colvars by a vector of weights, from either
+    # side. Storing each CV contiguously (column major) makes both products
+    # unit stride.
+    colvars = np.asfortranarray(colvars)
+
     # Setting jac = True indicates that the objective function also returns
     # the jacobian
     min_args = {"args": (colvars, is_accepted, use_jac),
@@ -230,28 +235,36 @@ def obj_func(to_opt: np.ndarray, colvars: np.ndarray, is_accepted: np.ndarray,
     """
     p_0 = to_opt[0]
     alphas = to_opt[1:]
-    r_vals, r_jac = calc_r(alphas, colvars, calc_jac)
-    p_vals, p_jac = calc_p(p_0, r_vals, r_jac)
+    r_vals, _ = calc_r(alphas, colvars, False)
+    p_vals, _ = calc_p(p_0, r_vals, None)
 
-    p_accepted = p_vals[is_accepted]
-    p_rejected = 1 - p_vals[~is_accepted]
+    # Probability of each state's actual outcome: p for accepted states and
+    # 1 - p for rejected ones. Selecting elementwise avoids gathering the
+    # accepted and rejected states into separate arrays on every call.
+    p_outcome = np.where(is_accepted, p_vals, 1 - p_vals)
 
     # -1 for minimization
-    obj_val = -1 * (np.sum(np.log(p_accepted)) + np.sum(np.log(p_rejected)))
+    obj_val = -1 * np.sum(np.log(p_outcome))
 
     obj_jacobian = None
     if calc_jac:
-        # this is (1 x n)
-        jac = np.ones(colvars.shape[0])
-
-        # derivatives of log of each p_val
-        jac[is_accepted] = 1 / p_accepted
-        jac[~is_accepted] = -1 / p_rejected
-
-        # -1 because of the optimization
-        jac *= -1
-
-        # (1 x n) x (n x m + 2) to get a (1 x m + 2) jacobian
-        obj_jacobian = np.matmul(jac, p_jac)
+        # this is (1 x n). Derivatives of log of each outcome's probability,
+        # 1 / p for accepted and -1 / (1 - p) for rejected, and -1 because of
+        # the optimization
+        jac = np.where(is_accepted, -1.0, 1.0) / p_outcome
+
+        # Apply the chain rule through calc_p and calc_r directly instead of
+        # building their (n x m + 2) jacobians, which is equivalent to
+        # (1 x n) x (n x m + 2) but avoids two large allocations per call
+        tanh_r = np.tanh(r_vals)
+        jac_r = jac * (-2 * p_0 * tanh_r * np.power(np.cosh(r_vals), -2))
+
+        obj_jacobian = np.empty(to_opt.size)
+        # d/dp_0
+        obj_jacobian[0] = np.matmul(jac, 1 - np.power(tanh_r, 2))
+        # d/dalpha_0, the constant term
+        obj_jacobian[1] = np.sum(jac_r)
+        # d/dalphas, weighted by their respective colvars
+        obj_jacobian[2:] = np.matmul(jac_r, colvars)
 
     return obj_val, obj_jacobian
@@ -2,7 +2,7 @@ import unittest
 
 from transition_sampling.engines import ShootingResult
 from transition_sampling.algo.aimless_shooting import AsyncAimlessShooting, \
-    generate_velocities
+    generate_velocities, generate_velocities_batch
 import numpy as np
 
 import tempfile
@@ -13,12 +13,13 @@ class NextPositionTest(unittest.TestCase):
     def test_pick_next_position(self):
         """Test some configurations of +1/0/-1 offset"""
 
-        # Set the seed for reproducible results.
-        np.random.seed(1)
+        # Seed a legacy RandomState for reproducible results, matching the
+        # stream the expected choices were generated with
+        np_rng = np.random.RandomState(1)
 
         with tempfile.TemporaryDirectory() as temp_dir:
 
-            aimless = AsyncAimlessShooting(None, None, 300, None)
+            aimless = AsyncAimlessShooting(None, None, 300, None, np_rng=np_rng)
             aimless.current_start = np.zeros((2, 3))
 
             fwd = {"commit": 1,
@@ -42,41 +43,41 @@ class VelocityGenerationTest(unittest.TestCase):
     """Test that velocity generation works"""
     def test_velocities_are_arrays(self):
 
-        # Set the seed for reproducible results.
-        np.random.seed(1)
+        # Seed a generator for reproducible results.
+        np_rng = np.random.default_rng(1)
 
         test_atoms = ['Ar'] * 1000
         test_temp1 = 300  # K
 
-        test_vel1 = generate_velocities(test_atoms, test_temp1)
+        test_vel1 = generate_velocities(test_atoms, test_temp1, np_rng)
 
         # Assert that a numpy array is returned.
         self.assertTrue(isinstance(test_vel1, np.ndarray))
 
     def test_velocity_shape(self):
 
-        # Set the seed for reproducible results.
-        np.random.seed(1)
+        # Seed a generator for reproducible results.
+        np_rng = np.random.default_rng(1)
 
         test_atoms = ['Ar'] * 1000
         test_temp1 = 300  # K
 
-        test_vel1 = generate_velocities(test_atoms, test_temp1)
+        test_vel1 = generate_velocities(test_atoms, test_temp1, np_rng)
 
         # Test that the shape of the velocities are correct.
         self.assertEqual(test_vel1.shape, (len(test_atoms), 3))
 
     def test_velocity_distribution_peak_location(self):
 
-        # Set the seed for reproducible results.
-        np.random.seed(1)
+        # Seed a generator for reproducible results.
+        np_rng = np.random.default_rng(1)
 
         test_atoms = ['Ar'] * 1000
         test_temp1 = 300  # K
         test_temp2 = 1000  # K
 
-        test_vel1 = generate_velocities(test_atoms, test_temp1)
-        test_vel2 = generate_velocities(test_atoms, test_temp2)
+        test_vel1 = generate_velocities(test_atoms, test_temp1, np_rng)
+        test_vel2 = generate_velocities(test_atoms, test_temp2, np_rng)
 
         # Histogram each velocity distribution and assert that the peak 
         # for T = 300 K is higher and occurs at a lower temperature
@@ -96,6 +97,21 @@ class VelocityGenerationTest(unittest.TestCase):
         self.assertTrue(max1 > max2)
         self.assertTrue(max_loc1 < max_loc2)
 
+    def test_batch_matches_single(self):
+        """Test that a batch matches the same number of single draws"""
+        test_atoms = ['Ar', 'Ca', 'Cl', 'Cl']
+        test_temp = 300  # K
+
+        batch = generate_velocities_batch(test_atoms, test_temp, 4,
+                                          np.random.default_rng(1))
+
+        np_rng = np.random.default_rng(1)
+        singles = [generate_velocities(test_atoms, test_temp, np_rng)
+                   for _ in range(4)]
+
+        self.assertEqual(batch.shape, (4, len(test_atoms), 3))
+        np.testing.assert_allclose(batch, np.stack(singles), rtol=1e-12)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,17 +1,18 @@
 import copy
+import io
 import os
-import shutil
-import tempfile
+import pathlib
+import pickle
 from unittest import TestCase
 
-import numpy as np
-
 from transition_sampling.engines import CP2KEngine
+from transition_sampling.tests.engine_tests.engine_interface import \
+    EngineInterfaceTests
 
 ENG_STR = "cp2k"
-CUR_DIR = os.path.dirname(__file__)
-TEST_INPUT = os.path.join(CUR_DIR, "test_data/test_cp2k.inp")
-TEST_PLUMED_FILE = os.path.join(CUR_DIR, "test_data/test_plumed.dat")
+TEST_DIR = os.path.join(os.path.dirname(__file__), "test_data")
+TEST_INPUT = os.path.join(TEST_DIR, "test_cp2k.inp")
+TEST_PLUMED_FILE = os.path.join(TEST_DIR, "test_plumed.dat")
 TEST_CMD = "test md_cmd"
 TEST_DELTA_T = 20
 
@@ -21,28 +22,36 @@ CORRECT_INPUTS = {"engine": ENG_STR,
                   "plumed_file": TEST_PLUMED_FILE,
                   "delta_t": 20}
 
+# Parse the input file once for the whole module. Only the pickled bytes are
+# kept, so no test can change the shared state and each test class unpickles
+# its own private engine.
+_PICKLED_ENGINE = pickle.dumps(CP2KEngine(CORRECT_INPUTS),
+                               protocol=pickle.HIGHEST_PROTOCOL)
+
 
 class CP2KEngineTestCase(TestCase):
     """
     TestCase subclass that sets up a valid CP2K engine before each test
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.engine = CP2KEngine(CORRECT_INPUTS)
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.engine = pickle.loads(_PICKLED_ENGINE)
 
         # Save the original inputs so we don't have to parse the input file
         # every time
-        self.original_cp2k_inputs = self.engine.cp2k_inputs
-
-        self.assertEqual(len(self.engine.atoms), 2)
+        cls._pickled_inputs = pickle.dumps(cls.engine.cp2k_inputs,
+                                           protocol=pickle.HIGHEST_PROTOCOL)
 
     def setUp(self) -> None:
-        # Instead of parsing the input file, deep copy the original inputs for
-        # the beginning of each test.
+        # Instead of parsing the input file, clone the original inputs for
+        # the beginning of each test. Unpickling the nested dicts is faster
+        # than deep copying them.
 
         # Drastically reduces test time (~1sec to ~ms)
-        self.engine.cp2k_inputs = copy.deepcopy(self.original_cp2k_inputs)
+        self.engine.cp2k_inputs = pickle.loads(self._pickled_inputs)
+
+        self.assertEqual(len(self.engine.atoms), 2)
 
 
 class TestCP2KEngineValidation(TestCase):
@@ -77,22 +86,16 @@ class TestCP2KEngineValidation(TestCase):
         """
         Create an almost valid cp2k input by deleting a line
         """
-        # Copy the test input to a tmp file without the first line. Yes there
-        # could be comments here, but not in our test file
-        with tempfile.NamedTemporaryFile() as temp_file:
-            with open(TEST_INPUT, 'rb') as clean_input:
-                # Read the first line so it doesn't get copied
-                clean_input.readline()
-                shutil.copyfileobj(clean_input, temp_file)
-
-                # Flush the buffer
-                temp_file.flush()
-
-            # Check that the invalid temp file fails
-            with self.assertRaises(ValueError,
-                                   msg="Invalid CP2K input should fail"):
-                self.editable_inputs["cp2k_inputs"] = temp_file.name
-                e = CP2KEngine(self.editable_inputs)
+        # Build an in-memory file of the test input without the first line.
+        # Yes there could be comments here, but not in our test file
+        with open(TEST_INPUT, 'r') as clean_input:
+            invalid_input = io.StringIO(clean_input.read().split("\n", 1)[1])
+
+        # Check that the invalid input fails
+        with self.assertRaises(ValueError,
+                               msg="Invalid CP2K input should fail"):
+            self.editable_inputs["cp2k_inputs"] = invalid_input
+            e = CP2KEngine(self.editable_inputs)
 
     def test_valid_input_file(self):
         """
@@ -101,113 +104,27 @@ class TestCP2KEngineValidation(TestCase):
         self.assertIsNotNone(CP2KEngine(CORRECT_INPUTS),
                              msg="Test input should be valid")
 
-
-# TODO: Most of these tests are for the interface. When more engines are added,
-# we should have one standard system (ex 2 Ar atoms) and run all engines with
-# these tests
-class TestCP2KEngineAtoms(CP2KEngineTestCase):
-    def test_atoms_getting(self):
-        """
-        Test that atoms returns the correct sequence
-        """
-        # TODO: Maybe a better input file that has different atoms
-        self.assertSequenceEqual(self.engine.atoms, ["Ar", "Ar"])
-
-    def test_atoms_setting(self):
-        """
-        Test that atoms cannot be set
-        """
-        with self.assertRaises(AttributeError,
-                               msg="Atoms should not be allowed assignment"):
-            self.engine.atoms = ['Co', 'O']
-
-
-class TestCP2KEngineBoxsize(CP2KEngineTestCase):
-    def test_box_getting(self):
-        """
-        Test that the correct box size is returned
-        """
-        correct_size = [10.10, 11.11, 12.12]
-        for expected, actual in zip(correct_size, self.engine.box_size):
-            self.assertEqual(expected, actual, msg="Box size not correct")
-
-    def test_box_setting(self):
-        """
-        Test that temperature cannot be set
-        """
-        with self.assertRaises(AttributeError,
-                               msg="Box size should not be allowed assignment"):
-            self.engine.box_size = (1, 2, 3)
-
-
-class TestCP2KEnginePositions(CP2KEngineTestCase):
-    def test_set_positions_wrong_num_atoms(self):
+    def test_valid_input_stream(self):
         """
-        Test there must be exactly one position for each atom
+        Provided input should also be accepted as an open file
         """
-        pos = np.array([[1.0021, 123.123, 1.2012]])
+        with open(TEST_INPUT, 'r') as f:
+            self.editable_inputs["cp2k_inputs"] = io.StringIO(f.read())
 
-        with self.assertRaises(ValueError, msg="There should be one row in "
-                                               "positions for each atom"):
-            self.engine.set_positions(pos)
+        e = CP2KEngine(self.editable_inputs)
+        self.assertSequenceEqual(e.atoms, ["Ar", "Ar"])
 
-    def test_set_positions_wrong_num_dims(self):
+    def test_valid_input_path_object(self):
         """
-        Test that an x, y, and z are required for each atom
+        Provided input should also be accepted as an os.PathLike
         """
-        pos = np.array([[1.0021, 123.123],
-                        [8.12, 6.12381]])
+        self.editable_inputs["cp2k_inputs"] = pathlib.Path(TEST_INPUT)
 
-        with self.assertRaises(ValueError,
-                               msg="There should be an x,y,z for each atom"):
-            self.engine.set_positions(pos)
-
-    def test_set_positions_valid(self):
-        """
-        Assign valid positions to ensure it works. Specifics are tested by the
-        CP2KInputHandler
-        """
-        pos = np.array([[1.0021, 123.123, 6.23123],
-                        [8.12, 6.12381, 0.1232]])
-
-        self.engine.set_positions(pos)
-
-
-class TestCP2KEngineVelocities(CP2KEngineTestCase):
-    def test_set_velocities_wrong_num_atoms(self):
-        """
-        Test there must be exactly one velocity vector for each atom
-        """
-        vel = np.array([[1.0021, 123.123, 1.2012]])
-
-        with self.assertRaises(ValueError, msg="There should be one row in "
-                                               "velocities for each atom"):
-            self.engine.set_velocities(vel)
-
-    def test_set_velocities_wrong_num_dims(self):
-        """
-        Test that an x, y, and z component are required for each atom
-        """
-        vel = np.array([[1.0021, 123.123],
-                        [8.12, 6.12381]])
-
-        with self.assertRaises(ValueError,
-                               msg="There should be an x,y,z for each atom"):
-            self.engine.set_velocities(vel)
-
-    def test_set_velocities_valid(self):
-        """
-        Assign valid velocities to ensure it works. Specifics checked by
-        CP2KInputsHandler
-        """
-        vel = np.array([[1.0021, 123.123, 6.23123],
-                        [8.12, 6.12381, 0.1232]])
-        self.engine.set_velocities(vel)
+        e = CP2KEngine(self.editable_inputs)
+        self.assertSequenceEqual(e.atoms, ["Ar", "Ar"])
 
-    def test_velocities_flip(self):
-        vel = np.array([[1.0021, 123.123, 6.23123],
-                        [8.12, 6.12381, 0.1232]])
 
-        self.engine.set_velocities(vel)
-        self.engine.flip_velocity()  # No way to actually check without writing
+class TestCP2KEngineInterface(EngineInterfaceTests, CP2KEngineTestCase):
+    """Standard engine interface tests run against the CP2K engine"""
 
+    BOX_SIZE = [10.10, 11.11, 12.12]
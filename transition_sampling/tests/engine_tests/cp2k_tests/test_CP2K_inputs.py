@@ -1,16 +1,31 @@
-import copy
+import io
 import os
+import pathlib
+import pickle
 import tempfile
 from unittest import TestCase
 
 import numpy as np
 
 from transition_sampling.engines.cp2k import CP2KInputsHandler
+from transition_sampling.engines.cp2k.CP2K_inputs import parse_cp2k_inputs
 
-CUR_DIR = os.path.dirname(__file__)
-TEST_INPUT = os.path.join(CUR_DIR, "test_data/test_cp2k.inp")
-TEST_OUTPUT = os.path.join(CUR_DIR, "test_data/test_cp2k_warnings.out")
-TEST_PLUMED_FILE = os.path.join(CUR_DIR, "test_data/test_plumed.dat")
+TEST_DIR = os.path.join(os.path.dirname(__file__), "test_data")
+TEST_INPUT = os.path.join(TEST_DIR, "test_cp2k.inp")
+
+# Parse the input file once for the whole module. Only the pickled bytes are
+# kept, so no test can change the shared state
+_PICKLED_INPUTS = pickle.dumps(CP2KInputsHandler(TEST_INPUT),
+                               protocol=pickle.HIGHEST_PROTOCOL)
+
+# Positions and velocities shared by the tests. Read-only so no test can
+# change them for the others
+_POS_FIXTURE = np.array([[1.0021, 123.123, 6.23123],
+                         [8.12, 6.12381, 0.1232]])
+_POS_FIXTURE.setflags(write=False)
+_VEL_FIXTURE = np.array([[1.0021, 123.123, 6.23123],
+                         [8.12, 6.12381, 0.1232]])
+_VEL_FIXTURE.setflags(write=False)
 
 
 class CP2KInputsTestCase(TestCase):
@@ -18,22 +33,33 @@ class CP2KInputsTestCase(TestCase):
     TestCase subclass that sets up a valid CP2K engine before each test
     """
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.inputs = CP2KInputsHandler(TEST_INPUT)
+    def setUp(self) -> None:
+        # Instead of parsing the input file, clone the original inputs for
+        # the beginning of each test. Unpickling the nested dicts is faster
+        # than deep copying them.
 
-        # Save the original inputs so we don't have to parse the input file
-        # every time
-        self.original_inputs = self.inputs
+        # Drastically reduces test time (~1sec to ~ms)
+        self.inputs = pickle.loads(_PICKLED_INPUTS)
 
         self.assertEqual(len(self.inputs.atoms), 2)
 
-    def setUp(self) -> None:
-        # Instead of parsing the input file, deep copy the original inputs for
-        # the beginning of each test.
 
-        # Drastically reduces test time (~1sec to ~ms)
-        self.inputs = copy.deepcopy(self.original_inputs)
+class TestCP2KInputsParsing(TestCase):
+    def test_parse_from_path_object(self):
+        """An os.PathLike is opened like a str path, not read as a stream"""
+        inputs = CP2KInputsHandler(pathlib.Path(TEST_INPUT))
+
+        self.assertEqual(inputs.cp2k_dict,
+                         pickle.loads(_PICKLED_INPUTS).cp2k_dict)
+
+    def test_write_to_path_object(self):
+        """An os.PathLike destination is opened like a str path"""
+        inputs = pickle.loads(_PICKLED_INPUTS)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            written = pathlib.Path(temp_dir, "written.inp")
+            inputs.write_cp2k_inputs(written)
+
+            self.assertEqual(parse_cp2k_inputs(written), _roundtrip(inputs))
 
 
 class TestCP2KInputsPositions(CP2KInputsTestCase):
@@ -41,45 +67,40 @@ class TestCP2KInputsPositions(CP2KInputsTestCase):
         """
         Assign valid positions and check the internal representation of them
         """
-        pos = np.array([[1.0021, 123.123, 6.23123],
-                        [8.12, 6.12381, 0.1232]])
+        pos = _POS_FIXTURE
 
         self.inputs.set_positions(pos)
 
-        self._compare_positions(pos, self.inputs)
+        self._compare_positions(pos, self.inputs.cp2k_dict)
 
     def test_set_positions_and_write(self):
         """
         Assign positions, write to a file, load into a new inputs, and see if
         they match
         """
-        pos = np.array([[1.0021, 123.123, 6.23123],
-                        [8.12, 6.12381, 0.1232]])
+        pos = _POS_FIXTURE
 
         self.inputs.set_positions(pos)
-        with tempfile.NamedTemporaryFile() as temp_file:
-            self.inputs.write_cp2k_inputs(temp_file.name)
 
-            # Load positions from the saved temp file
-            new_inputs = CP2KInputsHandler(temp_file.name)
+        # Load positions from the written inputs
+        new_cp2k_dict = _roundtrip(self.inputs)
 
-            self._compare_positions(pos, new_inputs)
+        self._compare_positions(pos, new_cp2k_dict)
 
-    def _compare_positions(self, expected, inputs):
+    def _compare_positions(self, expected, cp2k_dict):
         """
-        Compare expected positions to those actually stored by an engine
+        Compare expected positions to those actually stored in parsed inputs
         :param expected: Array of expected positions
-        :param inputs: engine to compare to
+        :param cp2k_dict: parsed inputs to compare to
         """
-        actual = inputs.cp2k_dict["+force_eval"][0]["+subsys"]["+coord"]["*"]
+        actual = cp2k_dict["+force_eval"][0]["+subsys"]["+coord"]["*"]
 
-        # Iterate over each stored and assigned position to compare
-        for s, p in zip(actual, expected):
-            # Convert string representation to list of floats
-            split_list = [float(num) for num in s[3:].split()]
-            # Convert numpy array to list for assertListEquals
-            p = p.tolist()
-            self.assertListEqual(p, split_list, "Positions were not equal")
+        # Convert string representations to one array of floats, skipping the
+        # atom names, and compare all positions at once
+        parsed = np.array([[float(num) for num in s[3:].split()]
+                           for s in actual])
+        np.testing.assert_array_equal(parsed, expected,
+                                      err_msg="Positions were not equal")
 
 
 class TestCP2KInputsVelocities(CP2KInputsTestCase):
@@ -87,55 +108,48 @@ class TestCP2KInputsVelocities(CP2KInputsTestCase):
         """
         Assign valid velocities and check the internal representation of them
         """
-        vel = np.array([[1.0021, 123.123, 6.23123],
-                        [8.12, 6.12381, 0.1232]])
+        vel = _VEL_FIXTURE
 
         self.inputs.set_velocities(vel)
-        self._compare_velocities(vel, self.inputs)
+        self._compare_velocities(vel, self.inputs.cp2k_dict)
 
     def test_set_velocities_and_write(self):
         """
         Assign velocities, write to a file, load into a new inputs, and see if
         they match
         """
-        vel = np.array([[1.0021, 123.123, 6.23123],
-                        [8.12, 6.12381, 0.1232]])
+        vel = _VEL_FIXTURE
 
         self.inputs.set_velocities(vel)
 
-        with tempfile.NamedTemporaryFile() as temp_file:
-            self.inputs.write_cp2k_inputs(temp_file.name)
+        # Load velocities from the written inputs
+        new_cp2k_dict = _roundtrip(self.inputs)
 
-            # Load velocities from the saved temp file
-            new_inputs = CP2KInputsHandler(temp_file.name)
-
-            self._compare_velocities(vel, new_inputs)
+        self._compare_velocities(vel, new_cp2k_dict)
 
     def test_flip_velocities(self):
         """Test that flipping velocities works"""
-        vel = np.array([[1.0021, 123.123, 6.23123],
-                        [8.12, 6.12381, 0.1232]])
+        vel = _VEL_FIXTURE
 
         self.inputs.set_velocities(vel)
         self.inputs.flip_velocity()
 
-        self._compare_velocities(-1 * vel, self.inputs)
+        self._compare_velocities(-1 * vel, self.inputs.cp2k_dict)
 
-    def _compare_velocities(self, expected, inputs):
+    def _compare_velocities(self, expected, cp2k_dict):
         """
-        Compare the expected values of a velocity to those actually stored by
-        an engine
+        Compare the expected values of a velocity to those actually stored in
+        parsed inputs
         :param expected: array of expected velocities
-        :param inputs: engine to check if velocities match
+        :param cp2k_dict: parsed inputs to check if velocities match
         """
         # Internal Representation of stored positions for CP2K
-        actual = inputs.cp2k_dict["+force_eval"][0]["+subsys"]["+velocity"]["*"]
+        actual = cp2k_dict["+force_eval"][0]["+subsys"]["+velocity"]["*"]
 
-        # Iterate over each stored and assigned position to compare
-        for s, v in zip(actual, expected):
-            # Convert numpy array to list for assertListEquals
-            v = v.tolist()
-            self.assertSequenceEqual(v, s, "Velocities were not equal")
+        # Velocities are already stored as numbers, so compare them directly
+        parsed = np.asarray(actual, dtype=np.float64)
+        np.testing.assert_array_equal(parsed, expected,
+                                      err_msg="Velocities were not equal")
 
 
 class TestCP2KInputsWritePlumed(CP2KInputsTestCase):
@@ -159,7 +173,7 @@ class TestCP2KInputsTimeStep(CP2KInputsTestCase):
     """Tests for CP2KInputs interactions with reading the timestep"""
 
     TEST_TRAJ_FILE = "test_cp2k-pos-1.xyz"
-    TEST_SILENT_INPUT = os.path.join(CUR_DIR, "test_data/test_cp2k_silent.inp")
+    TEST_SILENT_INPUT = os.path.join(TEST_DIR, "test_cp2k_silent.inp")
 
     def test_read_time_step(self):
         """Test that the time step is read correctly"""
@@ -203,3 +217,12 @@ class TestCP2KInputsTimeStep(CP2KInputsTestCase):
 
         self.assertEqual(traj["filename"], filename,
                          msg="Trajectory filename was not set correctly")
+
+
+def _roundtrip(inputs: CP2KInputsHandler) -> dict:
+    """Write inputs to an in-memory buffer and parse only the raw dictionary
+    back out of it, skipping construction of a new handler"""
+    buffer = io.StringIO()
+    inputs.write_cp2k_inputs(buffer)
+    buffer.seek(0)
+    return parse_cp2k_inputs(buffer)
@@ -1,4 +1,4 @@
-import filecmp
+import hashlib
 import os
 import tempfile
 from unittest import TestCase
@@ -7,15 +7,20 @@ import numpy as np
 
 from transition_sampling.engines.cp2k import CP2KOutputHandler
 
-CUR_DIR = os.path.dirname(__file__)
-TEST_DIR = os.path.join(CUR_DIR, "test_data")
-TEST_OUTPUT = os.path.join(CUR_DIR, "test_data/test_cp2k_warnings.out")
+TEST_DIR = os.path.join(os.path.dirname(__file__), "test_data")
+TEST_OUTPUT = os.path.join(TEST_DIR, "test_cp2k_warnings.out")
 
 
 class TestCP2KOutputHandler(TestCase):
 
-    def setUp(self) -> None:
-        self.out_handler = CP2KOutputHandler("test_cp2k_warnings", TEST_DIR)
+    @classmethod
+    def setUpClass(cls) -> None:
+        # The handlers are only read from, so they can be shared by every test
+        cls.out_handler = CP2KOutputHandler("test_cp2k_warnings", TEST_DIR)
+        cls.traj_handler = CP2KOutputHandler("test_cp2k", TEST_DIR)
+
+        # Digest of the original output, so copies only need one read each
+        cls._ref_digest = _sha256(TEST_OUTPUT)
 
     def test_output_handler_builds_path(self):
         """Test that output file name gets built correctly"""
@@ -26,25 +31,35 @@ class TestCP2KOutputHandler(TestCase):
         with tempfile.NamedTemporaryFile() as temp_file:
             self.out_handler.copy_out_file(temp_file.name)
 
-            self.assertTrue(filecmp.cmp(self.out_handler.get_out_file(),
-                                        temp_file.name), "files were not equal")
+            self.assertEqual(_sha256(temp_file.name), self._ref_digest,
+                             "files were not equal")
 
     def test_output_handler_catches_warnings(self):
         self.assertEqual(len(self.out_handler.check_warnings()), 1,
                          "Warnings were not caught")
 
+    def test_output_handler_caches_warnings(self):
+        self.assertIs(self.out_handler.check_warnings(),
+                      self.out_handler.check_warnings(),
+                      "Output file should only be scanned once")
+
     def test_output_handler_reads_frames(self):
-        out_handler = CP2KOutputHandler("test_cp2k", TEST_DIR)
         correct_traj = np.array(
             [[[-16.6194104932, -9.3251798220, 13.4782878910],
               [-7.6885011753, -0.2632985927, -20.2791742042]],
              [[-24.7001308568, -3.0687338669, 24.0999390591],
-              [-16.9070753990, -9.8118789758, -51.7361308628]]]).flatten()
-        result_traj = out_handler.read_frames_2_3().flatten()
+              [-16.9070753990, -9.8118789758, -51.7361308628]]])
+        result_traj = self.traj_handler.read_frames_2_3()
+
+        self.assertEqual(correct_traj.shape, result_traj.shape,
+                         "Read frames do not have the correct shape")
+
+        # Same bound as assertAlmostEqual with places=7
+        np.testing.assert_allclose(result_traj, correct_traj, rtol=0, atol=5e-8,
+                                   err_msg="Read frames were not equal")
 
-        self.assertEqual(correct_traj.size, result_traj.size,
-                         "Read frames do not have the correct size")
 
-        for i in range(correct_traj.size):
-            self.assertAlmostEqual(correct_traj[i], result_traj[i], places=7,
-                                   msg=f"Entry {i} was not equal")
+def _sha256(path: str) -> bytes:
+    """Get the SHA-256 digest of a file's contents"""
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).digest()
@@ -0,0 +1,96 @@
+"""
+Tests of the AbstractEngine interface that are shared by every engine
+"""
+import numpy as np
+
+
+class EngineInterfaceTests:
+    """Mixin of tests that every engine implementation should pass.
+
+    Mix into a TestCase that sets `self.engine` to the standard two Ar atom test
+    system before each test, and set `BOX_SIZE` to the box size of that engine's
+    test input.
+    """
+
+    BOX_SIZE = None
+
+    def test_atoms_getting(self):
+        """
+        Test that atoms returns the correct sequence
+        """
+        # TODO: Maybe a better input file that has different atoms
+        self.assertSequenceEqual(self.engine.atoms, ["Ar", "Ar"])
+
+    def test_atoms_setting(self):
+        """
+        Test that atoms cannot be set
+        """
+        with self.assertRaises(AttributeError,
+                               msg="Atoms should not be allowed assignment"):
+            self.engine.atoms = ['Co', 'O']
+
+    def test_box_getting(self):
+        """
+        Test that the correct box size is returned
+        """
+        for expected, actual in zip(self.BOX_SIZE, self.engine.box_size):
+            self.assertEqual(expected, actual, msg="Box size not correct")
+
+    def test_box_setting(self):
+        """
+        Test that temperature cannot be set
+        """
+        with self.assertRaises(AttributeError,
+                               msg="Box size should not be allowed assignment"):
+            self.engine.box_size = (1, 2, 3)
+
+    def test_set_positions(self):
+        """
+        Test there must be exactly one position with an x, y, and z for each
+        atom, and that valid positions can be assigned. Specifics are tested
+        with each engine's input handler
+        """
+        cases = [("wrong_num_atoms", np.array([[1.0021, 123.123, 1.2012]]),
+                  "There should be one row in positions for each atom"),
+                 ("wrong_num_dims", np.array([[1.0021, 123.123],
+                                              [8.12, 6.12381]]),
+                  "There should be an x,y,z for each atom"),
+                 ("valid", np.array([[1.0021, 123.123, 6.23123],
+                                     [8.12, 6.12381, 0.1232]]), None)]
+
+        for name, pos, msg in cases:
+            with self.subTest(name):
+                if msg is None:
+                    self.engine.set_positions(pos)
+                else:
+                    with self.assertRaises(ValueError, msg=msg):
+                        self.engine.set_positions(pos)
+
+    def test_set_velocities(self):
+        """
+        Test there must be exactly one velocity vector with an x, y, and z
+        component for each atom, and that valid velocities can be assigned.
+        Specifics are tested with each engine's input handler
+        """
+        cases = [("wrong_num_atoms", np.array([[1.0021, 123.123, 1.2012]]),
+                  "There should be one row in velocities for each atom"),
+                 ("wrong_num_dims", np.array([[1.0021, 123.123],
+                                              [8.12, 6.12381]]),
+                  "There should be an x,y,z for each atom"),
+                 ("valid", np.array([[1.0021, 123.123, 6.23123],
+                                     [8.12, 6.12381, 0.1232]]), None)]
+
+        for name, vel, msg in cases:
+            with self.subTest(name):
+                if msg is None:
+                    self.engine.set_velocities(vel)
+                else:
+                    with self.assertRaises(ValueError, msg=msg):
+                        self.engine.set_velocities(vel)
+
+    def test_velocities_flip(self):
+        vel = np.array([[1.0021, 123.123, 6.23123],
+                        [8.12, 6.12381, 0.1232]])
+
+        self.engine.set_velocities(vel)
+        self.engine.flip_velocity()  # No way to actually check without writing
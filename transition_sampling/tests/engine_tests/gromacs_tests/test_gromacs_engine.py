@@ -5,6 +5,8 @@ from unittest import TestCase
 import numpy as np
 
 from transition_sampling.engines import GromacsEngine
+from transition_sampling.tests.engine_tests.engine_interface import \
+    EngineInterfaceTests
 
 ENG_STR = "gromacs"
 CUR_DIR = os.path.dirname(__file__)
@@ -64,16 +66,19 @@ class TestGromacsEngineValidation(TestCase):
         """
         files = ["mdp", "top", "gro"]
         for file in files:
-            self.editable_inputs.pop(f"{file}_file")
-            with self.assertRaises(ValueError,
-                                   msg=f"Missing {file}_file should fail"):
-                e = GromacsEngine(self.editable_inputs)
-
-            # Input file does not exist
-            self.editable_inputs[f"{file}_file"] = "non_existent_file"
-            with self.assertRaises(ValueError,
-                                   msg=f"Non-existent {file}_file should fail"):
-                e = GromacsEngine(self.editable_inputs)
+            with self.subTest(file=file):
+                # Fresh copy so only this file is missing in each iteration
+                inputs = CORRECT_INPUTS.copy()
+                inputs.pop(f"{file}_file")
+                with self.assertRaises(ValueError,
+                                       msg=f"Missing {file}_file should fail"):
+                    e = GromacsEngine(inputs)
+
+                # Input file does not exist
+                inputs[f"{file}_file"] = "non_existent_file"
+                with self.assertRaises(ValueError,
+                                       msg=f"Non-existent {file}_file should fail"):
+                    e = GromacsEngine(inputs)
 
     def test_missing_grompp(self):
         """Check that not having a grompp command fails"""
@@ -97,110 +102,18 @@ class TestGromacsEngineValidation(TestCase):
                              msg="Test input should be valid")
 
 
-# TODO: Most of these tests are for the interface. When more engines are added,
-#   we should have one standard system (ex 2 Ar atoms) and run all engines with
-#   these tests
-class TestGromacsEngineAtoms(GromacsEngineTestCase):
-    def test_atoms_getting(self):
-        """
-        Test that atoms returns the correct sequence
-        """
-        self.assertSequenceEqual(self.engine.atoms, ["Ar", "Ar"])
-
-    def test_atoms_setting(self):
-        """
-        Test that atoms cannot be set
-        """
-        with self.assertRaises(AttributeError,
-                               msg="Atoms should not be allowed assignment"):
-            self.engine.atoms = ['Co', 'O']
-
-
-class TestGromacsEngineBoxsize(GromacsEngineTestCase):
-    def test_box_getting(self):
-        """
-        Test that the correct box size is returned
-        """
-        correct_size = [18.2060, 17.2060, 19.2060]
-        for expected, actual in zip(correct_size, self.engine.box_size):
-            self.assertEqual(expected, actual, msg="Box size not correct")
-
-    def test_box_setting(self):
-        """
-        Test that temperature cannot be set
-        """
-        with self.assertRaises(AttributeError,
-                               msg="Box size should not be allowed assignment"):
-            self.engine.box_size = (1, 2, 3)
-
-
-class TestGromacsEnginePositions(GromacsEngineTestCase):
-    def test_set_positions_wrong_num_atoms(self):
-        """
-        Test there must be exactly one position for each atom
-        """
-        pos = np.array([[1.0021, 123.123, 1.2012]])
-
-        with self.assertRaises(ValueError, msg="There should be one row in "
-                                               "positions for each atom"):
-            self.engine.set_positions(pos)
+class TestGromacsEngineInterface(EngineInterfaceTests, GromacsEngineTestCase):
+    """Standard engine interface tests run against the Gromacs engine"""
 
-    def test_set_positions_wrong_num_dims(self):
-        """
-        Test that an x, y, and z are required for each atom
-        """
-        pos = np.array([[1.0021, 123.123],
-                        [8.12, 6.12381]])
-
-        with self.assertRaises(ValueError,
-                               msg="There should be an x,y,z for each atom"):
-            self.engine.set_positions(pos)
-
-    def test_set_positions_valid(self):
-        """
-        Assign valid positions to ensure it works. Specifics are tested by the
-        GromacsInputHandler
-        """
-        pos = np.array([[1.0021, 123.123, 6.23123],
-                        [8.12, 6.12381, 0.1232]])
-
-        self.engine.set_positions(pos)
-
-
-class TestGromacsEngineVelocities(GromacsEngineTestCase):
-    def test_set_velocities_wrong_num_atoms(self):
-        """
-        Test there must be exactly one velocity vector for each atom
-        """
-        vel = np.array([[1.0021, 123.123, 1.2012]])
-
-        with self.assertRaises(ValueError, msg="There should be one row in "
-                                               "velocities for each atom"):
-            self.engine.set_velocities(vel)
-
-    def test_set_velocities_wrong_num_dims(self):
-        """
-        Test that an x, y, and z component are required for each atom
-        """
-        vel = np.array([[1.0021, 123.123],
-                        [8.12, 6.12381]])
-
-        with self.assertRaises(ValueError,
-                               msg="There should be an x,y,z for each atom"):
-            self.engine.set_velocities(vel)
-
-    def test_set_velocities_valid(self):
-        """
-        Assign valid velocities to ensure it works. Specifics checked by
-        GromacsInputsHandler
-        """
-        vel = np.array([[1.0021, 123.123, 6.23123],
-                        [8.12, 6.12381, 0.1232]])
-        self.engine.set_velocities(vel)
+    BOX_SIZE = [18.2060, 17.2060, 19.2060]
 
-    def test_velocities_flip(self):
-        vel = np.array([[1.0021, 123.123, 6.23123],
-                        [8.12, 6.12381, 0.1232]])
+    def test_set_velocities_does_not_modify_input(self):
+        """Unit conversion must not change the caller's (possibly read-only)
+        velocities"""
+        vels = np.arange(6, dtype=float).reshape(2, 3)
+        vels.flags.writeable = False
+        self.engine.set_velocities(vels)
 
-        self.engine.set_velocities(vel)
-        self.engine.flip_velocity()  # No way to actually check without writing
+        np.testing.assert_array_equal(vels, np.arange(6).reshape(2, 3))
+        np.testing.assert_allclose(self.engine.gro_struct.velocities,
+                                   vels / 1000)
@@ -7,6 +7,8 @@ from transition_sampling.engines.gromacs import MDPHandler
 
 CUR_DIR = os.path.dirname(__file__)
 MDP_DATA_DIR = os.path.join(CUR_DIR, "test_data/mdp")
+# Write scratch output to a RAM-backed tmpfs when one is available
+TMP_DIR = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
 
 
 class TestReadTimeStep(TestCase):
@@ -29,12 +31,19 @@ class TestReadTimeStep(TestCase):
 
 class TestWrite(TestCase):
 
-    def setUp(self) -> None:
-        """Open a tempfile to write output to during testing"""
-        self.tempfile = tempfile.NamedTemporaryFile()
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Open one tempfile to write output to for the whole suite"""
+        cls.tempfile = tempfile.NamedTemporaryFile(dir=TMP_DIR)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.tempfile.close()
 
-    def tearDown(self) -> None:
-        self.tempfile.close()
+    def setUp(self) -> None:
+        """Clear anything written by a previous test"""
+        self.tempfile.seek(0)
+        self.tempfile.truncate()
 
     def test_invalid_set_print(self):
         """Test that invalid print frequencies are denied"""
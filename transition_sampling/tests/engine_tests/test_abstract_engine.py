@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import asyncio
-import copy
 import os
 import subprocess
+from types import MappingProxyType, SimpleNamespace
 from typing import Tuple, Sequence
-from unittest import TestCase, mock
+from unittest import TestCase
 from unittest.mock import patch, MagicMock, call
 
 import numpy as np
@@ -14,26 +14,48 @@ from transition_sampling.engines import AbstractEngine, ShootingResult
 
 TEST_ENG_STR = "TEST_ENGINE"
 TEST_CMD = "test md_cmd"
+TEST_CMD_PARTS = TEST_CMD.split()
 CUR_DIR = os.path.dirname(__file__)
 TEST_PLUMED_FILE = os.path.join(CUR_DIR, "cp2k_tests/test_data/test_plumed.dat")
 
 
+async def _resolved(value):
+    """Coroutine that immediately returns the given value"""
+    return value
+
+
+def _finished_process(returncode: int = 0, stdout: bytes = b"",
+                      stderr: bytes = b"") -> MagicMock:
+    """Mock of an asyncio subprocess that has already exited"""
+    process = MagicMock(returncode=returncode)
+    process.communicate.side_effect = lambda: _resolved((stdout, stderr))
+    return process
+
+
+def _spawn_finished(*args, **kwargs):
+    """Stand in for the asyncio subprocess creation functions.
+
+    Patch these in with a plain MagicMock so the engine awaits the returned
+    coroutine itself, since AsyncMock is not available in Python 3.7
+    """
+    return _resolved(_finished_process())
+
+
 class AbstractEngineTestCase(TestCase):
     """Sets up editable inputs.
 
-    Here we define one "correct" set of inputs. For each test, we deep copy it
-    to an "editable inputs" that are allowed to be modified in whatever way the
-    test needs.
+    Here we define one "correct" set of inputs. For each test, we copy it to an
+    "editable inputs" that are allowed to be modified in whatever way the test
+    needs. All values are immutable, so a shallow copy is enough.
     """
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.correct_inputs = {"engine": TEST_ENG_STR,
-                               "md_cmd": TEST_CMD,
-                               "plumed_file": TEST_PLUMED_FILE,
-                               "delta_t": 20}
+    # Shared by every test, so read-only
+    correct_inputs = MappingProxyType({"engine": TEST_ENG_STR,
+                                       "md_cmd": TEST_CMD,
+                                       "plumed_file": TEST_PLUMED_FILE,
+                                       "delta_t": 20})
 
     def setUp(self) -> None:
-        self.editable_inputs = copy.deepcopy(self.correct_inputs)
+        self.editable_inputs = dict(self.correct_inputs)
 
 
 class AbstractEngineMock(AbstractEngine):
@@ -138,60 +160,93 @@ class TestAbstractEngineWorkingDirectory(AbstractEngineTestCase):
         e = AbstractEngineMock(self.correct_inputs, CUR_DIR)
         self.assertEqual(e.working_dir, CUR_DIR)
 
-    @patch("subprocess.Popen")
-    def test_launched_in_working_dir(self, popen_mock):
+    @patch("asyncio.create_subprocess_exec", new_callable=MagicMock,
+           side_effect=_spawn_finished)
+    def test_launched_in_working_dir(self, exec_mock):
         e = AbstractEngineMock(self.correct_inputs, CUR_DIR)
         asyncio.run(e._open_md_and_wait([], ""))
-        popen_mock.assert_called_with(mock.ANY,
-                                      cwd=CUR_DIR, shell=mock.ANY,
-                                      stderr=subprocess.PIPE,
-                                      stdout=subprocess.PIPE)
+        exec_mock.assert_called_with(*TEST_CMD_PARTS,
+                                     cwd=CUR_DIR,
+                                     stderr=subprocess.PIPE,
+                                     stdout=subprocess.PIPE)
 
 
 class TestAbstractEngineOpenMDAndWait(AbstractEngineTestCase):
-    @patch("subprocess.Popen")
-    def test_correct_cmd_no_sub(self, popen_mock: MagicMock):
+    def setUp(self) -> None:
+        super().setUp()
+        # Patch both ways of launching once for every test. Plain MagicMocks
+        # are used so the engine awaits the coroutines they return itself
+        exec_patcher = patch("asyncio.create_subprocess_exec",
+                             new_callable=MagicMock,
+                             side_effect=_spawn_finished)
+        shell_patcher = patch("asyncio.create_subprocess_shell",
+                              new_callable=MagicMock,
+                              side_effect=_spawn_finished)
+        self.exec_mock = exec_patcher.start()
+        self.shell_mock = shell_patcher.start()
+        self.addCleanup(exec_patcher.stop)
+        self.addCleanup(shell_patcher.stop)
+
+    def test_correct_cmd_no_sub(self):
         e = AbstractEngineMock(self.correct_inputs)
         cmd_args = ["-i", "test_arg"]
         asyncio.run(e._open_md_and_wait(cmd_args, ""))
-        popen_mock.assert_called_with(TEST_CMD.split() + cmd_args,
-                                      cwd=".", shell=False,
-                                      stderr=subprocess.PIPE,
-                                      stdout=subprocess.PIPE)
+        self.exec_mock.assert_called_with(*TEST_CMD_PARTS, *cmd_args,
+                                          cwd=".",
+                                          stderr=subprocess.PIPE,
+                                          stdout=subprocess.PIPE)
+        self.shell_mock.assert_not_called()
 
-    @patch("subprocess.Popen")
-    def test_correct_cmd_sub_without_quotes(self, popen_mock: MagicMock):
+    def test_correct_cmd_sub_without_quotes(self):
         self.editable_inputs["md_cmd"] = "command %CMD_ARGS%"
         e = AbstractEngineMock(self.editable_inputs)
         cmd_args = ["-i", "test_arg"]
         asyncio.run(e._open_md_and_wait(cmd_args, ""))
-        popen_mock.assert_called_with("command -i test_arg",
-                                      cwd=".", shell=True,
-                                      stderr=subprocess.PIPE,
-                                      stdout=subprocess.PIPE)
+        self.shell_mock.assert_called_with("command -i test_arg",
+                                           cwd=".",
+                                           stderr=subprocess.PIPE,
+                                           stdout=subprocess.PIPE)
+        self.exec_mock.assert_not_called()
 
-    @patch("subprocess.Popen")
-    def test_correct_cmd_sub_with_quotes(self, popen_mock: MagicMock):
+    def test_correct_cmd_sub_with_quotes(self):
         self.editable_inputs["md_cmd"] = 'command "put args here %CMD_ARGS%"'
         e = AbstractEngineMock(self.editable_inputs)
         cmd_args = ["-i", "test_arg"]
         asyncio.run(e._open_md_and_wait(cmd_args, ""))
-        popen_mock.assert_called_with('command "put args here -i test_arg"',
-                                      cwd=".", shell=True,
-                                      stderr=subprocess.PIPE,
-                                      stdout=subprocess.PIPE)
+        self.shell_mock.assert_called_with('command "put args here -i test_arg"',
+                                           cwd=".",
+                                           stderr=subprocess.PIPE,
+                                           stdout=subprocess.PIPE)
 
-    @patch("subprocess.Popen")
-    def test_returns_process_after_waiting(self, popen_mock: MagicMock):
+    def test_correct_cmd_sub_with_backslashes(self):
+        self.editable_inputs["md_cmd"] = "command %CMD_ARGS%"
+        e = AbstractEngineMock(self.editable_inputs)
+        cmd_args = ["-i", r"dir\new\1.inp"]
+        asyncio.run(e._open_md_and_wait(cmd_args, ""))
+        self.shell_mock.assert_called_with(r"command -i dir\new\1.inp",
+                                           cwd=".",
+                                           stderr=subprocess.PIPE,
+                                           stdout=subprocess.PIPE)
+
+    def test_returns_process_after_waiting(self):
         e = AbstractEngineMock(self.correct_inputs)
-        process_mock = mock.Mock()
-        # first poll, not finished. At second poll, it is finished and will
-        # return
-        process_mock.poll.side_effect = [None, True]
-        popen_mock.return_value = process_mock
+        process_mock = _finished_process(returncode=3, stdout=b"out",
+                                         stderr=b"err")
+        self.exec_mock.side_effect = \
+            lambda *args, **kwargs: _resolved(process_mock)
         result = asyncio.run(e._open_md_and_wait([], ""))
-        # make sure we get back what we gave it
-        self.assertEqual(result, process_mock)
+
+        # make sure we get back what the process gave once it finished
+        process_mock.communicate.assert_called_once()
+        self.assertEqual(result.returncode, 3)
+        self.assertEqual(result.stdout, b"out")
+        self.assertEqual(result.stderr, b"err")
+
+    @patch("asyncio.sleep")
+    def test_waits_without_polling(self, sleep_mock: MagicMock):
+        e = AbstractEngineMock(self.correct_inputs)
+        asyncio.run(e._open_md_and_wait([], ""))
+        sleep_mock.assert_not_called()
 
 
 class TestAbstractEngineSetInstance(AbstractEngineTestCase):
@@ -220,29 +275,67 @@ class TestAbstractEngineSetInstance(AbstractEngineTestCase):
 
 
 class TestAbstractEngineLaunchTrajectory(AbstractEngineTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        # Every test runs against an empty working directory unless it fills
+        # in its own entries, and nothing can actually be removed
+        scandir_patcher = patch("os.scandir")
+        unlink_patcher = patch("os.unlink")
+        self.scandir_mock = scandir_patcher.start()
+        self.unlink_mock = unlink_patcher.start()
+        self.addCleanup(scandir_patcher.stop)
+        self.addCleanup(unlink_patcher.stop)
+        self._set_dir_entries([])
+
     def test_running_without_instance_set_throws(self):
         with self.assertRaises(AttributeError,
                                msg="instance must be set before running"):
             e = AbstractEngineMock(self.correct_inputs)
             asyncio.run(e.run_shooting_point())
 
-    @patch("glob.glob")
-    def test_running_with_instance_set_succeeds(self, glob_mock: MagicMock):
-        glob_mock.return_value = []  # return empty list so no files are removed
+    def test_running_with_instance_set_succeeds(self):
         e = AbstractEngineMock(self.correct_inputs)
         e.set_instance(0, 1)
         asyncio.run(e.run_shooting_point())
+        self.unlink_mock.assert_not_called()
 
-    @patch("glob.glob")
-    @patch("os.remove")
-    def test_running_correct_plumed_files_removed(self, remove_mock: MagicMock,
-                                                  glob_mock: MagicMock):
+    def test_running_correct_plumed_files_removed(self):
         e = AbstractEngineMock(self.correct_inputs)
         e.set_instance(0, 1)
-        glob_mock.return_value = ['test_plumed_backup1', 'test_plumed_backup2']
+        backups = [SimpleNamespace(name=name, path=f"./{name}")
+                   for name in ("bck.0.PLUMED.OUT", "bck.1.PLUMED.OUT")]
+        others = [SimpleNamespace(name=name, path=f"./{name}")
+                  for name in ("PLUMED.OUT", "bck.0.COLVAR", "plumed.dat")]
+        self._set_dir_entries(backups + others)
+
         asyncio.run(e.run_shooting_point())
-        glob_mock.assert_called_with(f"./bck.*.PLUMED.OUT")
+        self.scandir_mock.assert_called_with(".")
+
+        self.unlink_mock.assert_has_calls([call(entry.path)
+                                           for entry in backups])
+        self.assertEqual(self.unlink_mock.call_count, len(backups),
+                         "Only plumed backups should be removed")
 
-        remove_mock.assert_has_calls([call(val) for val in glob_mock.return_value])
+    def test_running_launches_trajectories_concurrently(self):
+        e = AbstractEngineMock(self.correct_inputs)
+        e.set_instance(0, 1)
+
+        events = []
+
+        async def record_launch(projname: str) -> dict:
+            events.append(("start", projname))
+            # Hand control back to the event loop as a running MD process would
+            await asyncio.sleep(0)
+            events.append(("end", projname))
+
+        e._launch_traj = record_launch
+        asyncio.run(e.run_shooting_point())
 
+        # Both trajectories should start before either of them finishes
+        self.assertEqual([event for event, _ in events],
+                         ["start", "start", "end", "end"],
+                         "Forward and reverse trajectories did not overlap")
 
+    def _set_dir_entries(self, entries: list) -> None:
+        """Set the entries the patched os.scandir lists"""
+        self.scandir_mock.return_value.__enter__.return_value = iter(entries)
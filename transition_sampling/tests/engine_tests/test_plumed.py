@@ -1,5 +1,6 @@
-import filecmp
+import io
 import os
+import pathlib
 import tempfile
 from unittest import TestCase
 
@@ -16,13 +17,6 @@ class TestPlumedOutputWriting(TestCase):
 
     SET_FILE_ARG_TO = "test_file_arg"
 
-    def setUp(self) -> None:
-        """Open a tempfile to write output to during testing"""
-        self.tempfile = tempfile.NamedTemporaryFile()
-
-    def tearDown(self) -> None:
-        self.tempfile.close()
-
     def test_non_existent_file(self):
         """Test that the plumed file must exist"""
         with self.assertRaises(ValueError,
@@ -54,11 +48,7 @@ class TestPlumedOutputWriting(TestCase):
         correct = os.path.join(PLUMED_DATA_DIR,
                                "one_line_committor_correct.dat")
 
-        handler = PlumedInputHandler(one_line)
-        handler.write_plumed(self.tempfile.name, self.SET_FILE_ARG_TO)
-
-        self.assertTrue(filecmp.cmp(correct, self.tempfile.name, True),
-                        "Files are expected to be equal")
+        self._assert_insertion(one_line, correct)
 
     def test_insertion_multi_line(self):
         """Test that the FILE arg is inserted correctly when the COMMITTOR
@@ -69,11 +59,7 @@ class TestPlumedOutputWriting(TestCase):
         correct = os.path.join(PLUMED_DATA_DIR,
                                "multi_line_committor_correct.dat")
 
-        handler = PlumedInputHandler(multi_line)
-        handler.write_plumed(self.tempfile.name, self.SET_FILE_ARG_TO)
-
-        self.assertTrue(filecmp.cmp(correct, self.tempfile.name, True),
-                        "Files are expected to be equal")
+        self._assert_insertion(multi_line, correct)
 
     def test_committor_comment(self):
         """Test that a comment containing 'COMMITTOR' won't be flagged as a
@@ -83,12 +69,46 @@ class TestPlumedOutputWriting(TestCase):
         correct = os.path.join(PLUMED_DATA_DIR,
                                "committor_comment_correct.dat")
 
-        handler = PlumedInputHandler(comment)
-        handler.write_plumed(self.tempfile.name, self.SET_FILE_ARG_TO)
+        self._assert_insertion(comment, correct)
 
-        self.assertTrue(filecmp.cmp(correct, self.tempfile.name, True),
-                        "Files are expected to be equal")
+    def test_write_to_path(self):
+        """Test that the plumed file can be written to a path as well"""
+        one_line = os.path.join(PLUMED_DATA_DIR, "one_line_committor_base.dat")
+        correct = os.path.join(PLUMED_DATA_DIR,
+                               "one_line_committor_correct.dat")
 
+        handler = PlumedInputHandler(one_line)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            written = os.path.join(temp_dir, "plumed.dat")
+            handler.write_plumed(written, self.SET_FILE_ARG_TO)
+
+            self.assertTrue(_files_equal(correct, written),
+                            "Files are expected to be equal")
+
+    def test_write_to_path_object(self):
+        """Test that the plumed file can be written to an os.PathLike"""
+        one_line = os.path.join(PLUMED_DATA_DIR, "one_line_committor_base.dat")
+        correct = os.path.join(PLUMED_DATA_DIR,
+                               "one_line_committor_correct.dat")
+
+        handler = PlumedInputHandler(one_line)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            written = pathlib.Path(temp_dir, "plumed.dat")
+            handler.write_plumed(written, self.SET_FILE_ARG_TO)
+
+            self.assertTrue(_files_equal(correct, written),
+                            "Files are expected to be equal")
+
+    def _assert_insertion(self, base: str, correct: str) -> None:
+        """Write the base plumed file to memory with the FILE arg inserted and
+        compare it to the correct file"""
+        handler = PlumedInputHandler(base)
+        written = io.StringIO()
+        handler.write_plumed(written, self.SET_FILE_ARG_TO)
+
+        with open(correct) as f:
+            self.assertEqual(written.getvalue(), f.read(),
+                             "Files are expected to be equal")
 
 
 class TestPlumedReadingBasins(TestCase):
@@ -101,6 +121,16 @@ class TestPlumedReadingBasins(TestCase):
 
         self.assertIsNone(handler.check_basin())
 
+    def test_did_not_commit_with_output(self):
+        """Test a file with committor output but no committed basin returns
+        None"""
+        with tempfile.NamedTemporaryFile("w") as f:
+            f.write("#! FIELDS time cv1\n 0.000000 0.340782\n")
+            f.flush()
+            handler = PlumedOutputHandler(f.name)
+
+            self.assertIsNone(handler.check_basin())
+
     def test_committed_basin_1_typo(self):
         """Test a file that commits to basin 1 with COMMITED typo"""
         file = os.path.join(PLUMED_DATA_DIR, "committed_to_1_typo.out")
@@ -118,3 +148,31 @@ class TestPlumedReadingBasins(TestCase):
 
         self.assertEqual(1, handler.check_basin(), "Expected basin to be 1")
 
+    def test_committed_with_trailing_non_matching_line(self):
+        """Test a committed basin is still found when a later "SET COMMIT" line
+        does not match the committing pattern"""
+        with tempfile.NamedTemporaryFile("w") as f:
+            f.write("#! FIELDS time cv1\n 0.000000 0.340782\n"
+                    "SET COMMITTED TO BASIN 2\n"
+                    "SET COMMIT interrupted\n")
+            f.flush()
+            handler = PlumedOutputHandler(f.name)
+
+            self.assertEqual(2, handler.check_basin(), "Expected basin to be 2")
+
+    def test_multiple_committed_lines_uses_last(self):
+        """Test that the last committing line wins when there are several"""
+        with tempfile.NamedTemporaryFile("w") as f:
+            f.write("SET COMMITTED TO BASIN 1\n"
+                    "SET COMMITTED TO BASIN 2\n"
+                    "SET COMMIT interrupted\n")
+            f.flush()
+            handler = PlumedOutputHandler(f.name)
+
+            self.assertEqual(2, handler.check_basin(), "Expected basin to be 2")
+
+
+def _files_equal(file_a: str, file_b: str) -> bool:
+    """Compare the full contents of two files byte by byte"""
+    with open(file_a, "rb") as a, open(file_b, "rb") as b:
+        return a.read() == b.read()
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import copy
+import functools
 import os
+import shutil
 import tempfile
-from unittest import TestCase
+from unittest import TestCase, skipUnless
 import random
 
 import numpy as np
@@ -33,9 +36,32 @@ INPUTS = {"engine": "cp2k",
 TEMP = 300
 
 
+@skipUnless(shutil.which(CP2K_CMD), "CP2K is not installed")
 class TestAimlessShootingIntegration(TestCase):
     """Test running the aimless shooting algorithm with CP2K"""
 
+    @classmethod
+    def setUpClass(cls):
+        # Parse the CP2K and plumed templates once and share a single scratch
+        # directory between tests. Each test works in its own subdirectory.
+        cls._tmp = tempfile.mkdtemp()
+        cls._engine_template = CP2KEngine(INPUTS, cls._tmp)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._tmp)
+
+    def _make_dirs(self) -> tuple[str, str]:
+        """Create fresh algo results and engine working dirs for one test"""
+        return (tempfile.mkdtemp(dir=self._tmp),
+                tempfile.mkdtemp(dir=self._tmp))
+
+    def _make_engine(self, engine_dir: str) -> CP2KEngine:
+        """Copy the template engine, working in `engine_dir`"""
+        engine = copy.deepcopy(self._engine_template)
+        engine.working_dir = engine_dir
+        return engine
+
     def test_integration_single(self):
         """Run some aimless shooting trials with CP2K.
 
@@ -48,33 +74,34 @@ class TestAimlessShootingIntegration(TestCase):
 
         Test data built with Plumed v2.6.1 and CP2K v7.1.0
         """
-        # Set seed for reproducible comparison
-        np.random.seed(1)
-        random.seed(2)
+        # Seed for reproducible comparison. The expected results were generated
+        # from the legacy global streams, which these reproduce
+        rng = random.Random(2)
+        np_rng = np.random.RandomState(1)
 
         # Create directory for algo results and engine working space
-        with tempfile.TemporaryDirectory() as algo_dir:
-            result_name = f"{algo_dir}/results"
+        algo_dir, engine_dir = self._make_dirs()
+        result_name = f"{algo_dir}/results"
 
-            logger = ResultsLogger(result_name)
+        logger = ResultsLogger(result_name)
 
-            with tempfile.TemporaryDirectory() as engine_dir:
-                engine = CP2KEngine(INPUTS, engine_dir)
-                # set instance manually since we aren't using the driver
-                engine.set_instance(0, 1)
+        engine = self._make_engine(engine_dir)
+        # set instance manually since we aren't using the driver
+        engine.set_instance(0, 1)
 
-                algo = AsyncAimlessShooting(engine, STARTS_DIR, TEMP, logger)
+        algo = AsyncAimlessShooting(engine, STARTS_DIR, TEMP, logger,
+                                    rng=rng, np_rng=np_rng)
 
-                # Run algorithm to generate 5 accepteds with 3 state attempts
-                # and 5 velocity attempts.
-                asyncio.run(algo.run(n_points=5, n_state_tries=3, n_vel_tries=5))
+        # Run algorithm to generate 5 accepteds with 3 state attempts
+        # and 5 velocity attempts.
+        asyncio.run(algo.run(n_points=5, n_state_tries=3, n_vel_tries=5))
 
-                # Run algorithm to generate 5 accepteds with 3 state attempts
-                # and 1 velocity attempt
-                asyncio.run(algo.run(n_points=5, n_state_tries=3, n_vel_tries=1))
+        # Run algorithm to generate 5 accepteds with 3 state attempts
+        # and 1 velocity attempt
+        asyncio.run(algo.run(n_points=5, n_state_tries=3, n_vel_tries=1))
 
-            self._compare_results([f"{SINGLE_EXPECTED_DIR}/expected"],
-                                  [result_name])
+        self._compare_results([f"{SINGLE_EXPECTED_DIR}/expected"],
+                              [result_name])
 
     def test_integration_parallel(self):
         """Run some aimless shooting trials with CP2K, in parallel.
@@ -94,31 +121,31 @@ class TestAimlessShootingIntegration(TestCase):
 
         Test data built with Plumed v2.6.1 and CP2K v7.1.0
         """
-        # Set seed for reproducible comparison, but not really because the
+        # Seed for reproducible comparison, but not really because the
         # execution order is non-deterministic.
-        np.random.seed(1)
-        random.seed(2)
+        rng = random.Random(2)
+        np_rng = np.random.RandomState(1)
 
         # Create directory for algo results and engine working space
-        with tempfile.TemporaryDirectory() as algo_dir:
-            result_name = f"{algo_dir}/results"
+        algo_dir, engine_dir = self._make_dirs()
+        result_name = f"{algo_dir}/results"
 
-            with tempfile.TemporaryDirectory() as engine_dir:
-                engine = CP2KEngine(INPUTS, engine_dir)
+        engine = self._make_engine(engine_dir)
 
-                algo = AimlessShootingDriver(engine, STARTS_DIR, TEMP, result_name)
+        algo = AimlessShootingDriver(engine, STARTS_DIR, TEMP, result_name,
+                                     rng=rng, np_rng=np_rng)
 
-                # Run 3 parallel algorithms to generate 10 accepteds with 3
-                # state attempts and 5 velocity attempts.
-                algo.run(3, n_points=10, n_state_tries=3, n_vel_tries=5)
+        # Run 3 parallel algorithms to generate 10 accepteds with 3
+        # state attempts and 5 velocity attempts.
+        algo.run(3, n_points=10, n_state_tries=3, n_vel_tries=5)
 
-            xyzs = [xyzlib.read_xyz_file(f"{result_name}{i}.xyz") for i in range(3)]
+        xyzs = [xyzlib.read_xyz_file(f"{result_name}{i}.xyz") for i in range(3)]
 
-            # check that each of the XYZ outputs are different
-            for i in range(len(xyzs)):
-                for j in range(i+1, len(xyzs)):
-                    self.assertFalse(np.array_equal(xyzs[i], xyzs[j]),
-                                     msg=f"xyz of {i} and {j} were equal")
+        # check that each of the XYZ outputs are different
+        for i in range(len(xyzs)):
+            for j in range(i+1, len(xyzs)):
+                self.assertFalse(np.array_equal(xyzs[i], xyzs[j]),
+                                 msg=f"xyz of {i} and {j} were equal")
 
     def _compare_results(self, expected: list[str], results: list[str]) -> None:
         """Compare n xyz and csv results
@@ -133,12 +160,10 @@ class TestAimlessShootingIntegration(TestCase):
             List of results corresponding to the expected list to be compared
         """
         for exp_name, res_name in zip(expected, results):
-            exp_csv = f"{exp_name}.csv"
             res_csv = f"{res_name}.csv"
-            exp_xyz = f"{exp_name}.xyz"
             res_xyz = f"{res_name}.xyz"
 
-            expected_df = pd.read_csv(exp_csv)
+            expected_df, expected_frames = _load_expected(exp_name)
             result_df = pd.read_csv(res_csv)
 
             # Test rows in the CSV
@@ -150,23 +175,44 @@ class TestAimlessShootingIntegration(TestCase):
             pd.testing.assert_frame_equal(expected_df, result_df,
                                           obj=f"{res_csv} DataFrame")
 
-            # Testing coordinates picked are the same
-            with open(exp_xyz, "r") as expected_xyzf, \
-                    open(res_xyz, "r") as results_xyzf:
-                expected_frame, expected_eof = xyzlib.read_xyz_frame(expected_xyzf)
+            # Testing coordinates picked are the same. An identical file is the
+            # common case, so only parse the frames when the bytes differ
+            if _files_equal(f"{exp_name}.xyz", res_xyz):
+                continue
+
+            # Load every frame at once and compare them all in one call
+            result_frames = xyzlib.read_xyz_file(res_xyz)
+            self.assertEqual(expected_frames.shape, result_frames.shape,
+                             msg=f"{res_xyz} does not have the expected number "
+                                 f"of frames and atoms")
+
+            np.testing.assert_allclose(expected_frames, result_frames,
+                                       rtol=1e-7,
+                                       err_msg=f"Frames do not match for {res_xyz}")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_expected(exp_name: str) -> tuple[pd.DataFrame, np.ndarray]:
+    """Load an expected csv and xyz file pair, only parsing each pair once.
+
+    The returned objects are shared between callers and must not be modified.
 
-                frame = 0
-                while not expected_eof:
-                    result_frame, result_eof = xyzlib.read_xyz_frame(results_xyzf)
-                    self.assertFalse(result_eof, msg=f"{res_xyz} ended early")
+    Parameters
+    ----------
+    exp_name
+        Base name of the expected file pair, e.g. "exp1" for the pair
+        ("exp1.csv", "exp1.xyz")
 
-                    np.testing.assert_allclose(expected_frame, result_frame,
-                                               rtol=1e-7,
-                                               err_msg=f"Frame {frame} does not match for {res_xyz}")
+    Returns
+    -------
+    The expected DataFrame and every expected frame, with shape
+    (n_frames, n_atoms, 3)
+    """
+    return (pd.read_csv(f"{exp_name}.csv"),
+            xyzlib.read_xyz_file(f"{exp_name}.xyz"))
 
-                    expected_frame, expected_eof = xyzlib.read_xyz_frame(expected_xyzf)
-                    frame += 1
 
-                # Make sure nothing at the end of the results
-                _, result_eof = xyzlib.read_xyz_frame(results_xyzf)
-                self.assertTrue(result_eof, msg=f"{res_xyz} should have ended")
+def _files_equal(file_a: str, file_b: str) -> bool:
+    """Compare the full contents of two files byte by byte"""
+    with open(file_a, "rb") as a, open(file_b, "rb") as b:
+        return a.read() == b.read()
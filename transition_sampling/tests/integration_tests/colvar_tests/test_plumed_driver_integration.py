@@ -1,6 +1,8 @@
+import filecmp
 import os
+import shutil
 import tempfile
-from unittest import TestCase
+from unittest import TestCase, skipUnless
 import subprocess
 
 from transition_sampling.colvar import PlumedDriver
@@ -20,6 +22,7 @@ MULTIPLE_BOX_CSV = os.path.join(CUR_DIR, "test_data/multiple_box_input.csv")
 PLUMED_BIN = "plumed"
 
 
+@skipUnless(shutil.which(PLUMED_BIN), "PLUMED is not installed")
 class TestPlumedDriverIntegration(TestCase):
     """Test running the plumed driver with an aimless shooting output"""
 
@@ -36,10 +39,15 @@ class TestPlumedDriverIntegration(TestCase):
 
             driver.run(DEFAULT_PLUMED_DAT, INPUT_XYZ, INPUT_CSV, results_colvar)
 
-            # Compare files as a list so there is feedback on differences
-            self.assertListEqual([row for row in open(EXPECTED_DEFAULT_CV)],
-                                 [row for row in open(results_colvar)],
-                                 msg="Files are expected to be equal")
+            # Compare bytes first, only reading the files as lists so there is
+            # feedback on differences when they don't match
+            if not filecmp.cmp(EXPECTED_DEFAULT_CV, results_colvar,
+                               shallow=False):
+                with open(EXPECTED_DEFAULT_CV) as expected, \
+                        open(results_colvar) as result:
+                    self.assertListEqual(expected.readlines(),
+                                         result.readlines(),
+                                         msg="Files are expected to be equal")
 
     def test_invalid_plumed_fails(self):
         """
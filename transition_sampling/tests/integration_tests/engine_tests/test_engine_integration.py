@@ -1,13 +1,17 @@
+from __future__ import annotations
+
+import copy
 import os
-import pickle
+import shutil
 import tempfile
-from unittest import TestCase
+from unittest import TestCase, skipUnless
 import asyncio
 
 import numpy as np
 
-from transition_sampling.engines import AbstractEngine, CP2KEngine, GromacsEngine
-from transition_sampling.algo.aimless_shooting import generate_velocities
+from transition_sampling.engines import AbstractEngine, CP2KEngine, \
+    GromacsEngine, ShootingResult
+from transition_sampling.algo.aimless_shooting import generate_velocities_batch
 
 CUR_DIR = os.path.dirname(__file__)
 TEST_PLUMED = os.path.join(CUR_DIR, "../shared_test_data/plumed.dat")
@@ -16,8 +20,47 @@ TEST_PLUMED = os.path.join(CUR_DIR, "../shared_test_data/plumed.dat")
 STARTING_POSITIONS = os.path.join(CUR_DIR, "test_data/starting_pos.npy")
 STARTING_VELOCITIES = os.path.join(CUR_DIR, "test_data/starting_vels.npy")
 
+# Location of the MD executables in docker image lemmoi:transition_sampling
+CP2K_CMD = "/src/cp2k.ssmp"
+GMX_CMD = "gmx"
+
 
 class EngineIntegrationBase(TestCase):
+    """Base for engine integration tests.
+
+    Subclasses set `engine_class`, `results` (path of the .npz holding the
+    expected ShootingResults, see `_load_results`), `inputs` and `md_threads`
+    (threads used by a single MD run) as class attributes.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        # nothing to load if not subclassed
+        if not hasattr(cls, "inputs"):
+            return
+
+        # Load the starting configurations once for every test in the class.
+        # Shape is (n_tests, n_atoms, xyz) so each test's config is contiguous.
+        # Memory map them read-only so only the configs that are used get read.
+        # Engines copy what they are given (GromacsEngine converts velocity
+        # units out of place), so nothing writes back to these arrays.
+        cls.starting_pos = np.load(STARTING_POSITIONS, mmap_mode="r")
+        cls.starting_vels = np.load(STARTING_VELOCITIES, mmap_mode="r")
+
+        # Load the list of saved ShootingResults that are expected
+        cls.expected = _load_results(cls.results)
+
+        # Build the engine once for the class. Tests copy it before modifying
+        # it, so it stays a clean template
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.engine = cls.engine_class(cls.inputs, cls._tmp.name)
+        cls.engine.set_instance(0, 1)
+
+    @classmethod
+    def tearDownClass(cls):
+        if hasattr(cls, "_tmp"):
+            cls._tmp.cleanup()
+
     def test_fixed_ions(self):
         """Fix two ions, let a third ion commit to either of them.
 
@@ -35,75 +78,150 @@ class EngineIntegrationBase(TestCase):
         if not hasattr(self, "inputs"):
             return None
 
-        # Load the starting configurations. Shape is (n_atoms, xyz, n_tests)
-        starting_pos = np.load(STARTING_POSITIONS)
-        starting_vels = np.load(STARTING_VELOCITIES)
+        expected = self.expected
 
-        # Load the list of saved ShootingResults that are expected
-        with open(self.results, "rb") as res:
-            expected = pickle.load(res)
-
-        with tempfile.TemporaryDirectory() as directory:
-            engine = self.engine_class(self.inputs, directory)
-            engine.set_instance(0, 1)
-            for i, sr in enumerate(expected):
-                # Set this test's starting config
-                engine.set_positions(starting_pos[:, :, i])
-                engine.set_velocities(starting_vels[:, :, i])
-
-                result = asyncio.run(engine.run_shooting_point())
-
-                # Compare the expected ShootingResult to the returned one.
-                self.assertEqual(sr.fwd["commit"], result.fwd["commit"])
-                self.assertEqual(sr.rev["commit"], result.rev["commit"])
-                np.testing.assert_allclose(sr.fwd["frames"],
-                                           result.fwd["frames"], rtol=1e-5, atol=1e-5,
-                                           err_msg=f"Run {i} fwd did not match")
-                np.testing.assert_allclose(sr.rev["frames"],
-                                           result.rev["frames"], rtol=1e-5, atol=1e-5,
-                                           err_msg=f"Run {i} rev did not match")
+        results = asyncio.run(_run_all(self.engine, self.starting_pos,
+                                       self.starting_vels, len(expected),
+                                       self.md_threads))
+
+        for i, (sr, result) in enumerate(zip(expected, results)):
+            # Compare the expected ShootingResult to the returned one.
+            self.assertEqual(sr.fwd["commit"], result.fwd["commit"])
+            self.assertEqual(sr.rev["commit"], result.rev["commit"])
+            for direction in ("fwd", "rev"):
+                expected_frames = getattr(sr, direction)["frames"]
+                result_frames = getattr(result, direction)["frames"]
+
+                # Only build the detailed mismatch report when they differ
+                if not np.allclose(expected_frames, result_frames,
+                                   rtol=1e-5, atol=1e-5):
+                    np.testing.assert_allclose(
+                        expected_frames, result_frames, rtol=1e-5, atol=1e-5,
+                        err_msg=f"Run {i} {direction} did not match")
 
         # This can be used to generate expected results for new tests if needed
-        # by making a result_list and appending the result of each to it
-        # with open(RESULTS, "wb") as out:
-        #     pickle.dump(result_list, out, pickle.HIGHEST_PROTOCOL)
+        # from the list of returned results
+        # _save_results(self.results, results)
 
 
+@skipUnless(shutil.which(CP2K_CMD), "CP2K is not installed")
 class TestCP2KIntegration(EngineIntegrationBase):
     """Test data built with Plumed v2.6.1, CP2K v7.1.0"""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.engine_class = CP2KEngine
-        self.results = os.path.join(CUR_DIR, "test_data/cp2k_results.pkl")
-        self.inputs = {"engine": "cp2k",
-                       "cp2k_inputs": os.path.join(CUR_DIR, "../shared_test_data/cp2k.inp"),
-                       # Location of the cp2k executable in docker image lemmoi:transition_sampling
-                       "md_cmd": "/src/cp2k.ssmp",
-                       "plumed_file": TEST_PLUMED,
-                       "delta_t": 10}
+    engine_class = CP2KEngine
+    # cp2k.ssmp is OpenMP threaded and uses every core unless told otherwise
+    md_threads = int(os.environ.get("OMP_NUM_THREADS") or os.cpu_count() or 1)
+    results = os.path.join(CUR_DIR, "test_data/cp2k_results.npz")
+    inputs = {"engine": "cp2k",
+              "cp2k_inputs": os.path.join(CUR_DIR, "../shared_test_data/cp2k.inp"),
+              "md_cmd": CP2K_CMD,
+              "plumed_file": TEST_PLUMED,
+              "delta_t": 10}
 
 
+@skipUnless(shutil.which(GMX_CMD), "GROMACS is not installed")
 class TestGromacsIntegration(EngineIntegrationBase):
     """Test data built with Plumed v2.6.1, GROMACS 2020.6"""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.engine_class = GromacsEngine
-        self.results = os.path.join(CUR_DIR, "test_data/gromacs_results.pkl")
-        self.inputs = {"engine": "gromacs",
-                       "gro_file": os.path.join(CUR_DIR, "../shared_test_data/gromacs.gro"),
-                       "top_file": os.path.join(CUR_DIR, "../shared_test_data/gromacs.top"),
-                       "mdp_file": os.path.join(CUR_DIR, "../shared_test_data/gromacs.mdp"),
-                       # Location of the gromacs executables in docker image lemmoi:transition_sampling
-                       "md_cmd": "gmx mdrun -nt 2",
-                       "grompp_cmd": "gmx grompp",
-                       "plumed_file": TEST_PLUMED,
-                       "delta_t": 100,
-                       "should_pin": False}
-
-
-def _generate_fixed_starts(n_tests: int, engine: AbstractEngine) -> None:
+    engine_class = GromacsEngine
+    # Matches -nt in md_cmd below
+    md_threads = 2
+    results = os.path.join(CUR_DIR, "test_data/gromacs_results.npz")
+    inputs = {"engine": "gromacs",
+              "gro_file": os.path.join(CUR_DIR, "../shared_test_data/gromacs.gro"),
+              "top_file": os.path.join(CUR_DIR, "../shared_test_data/gromacs.top"),
+              "mdp_file": os.path.join(CUR_DIR, "../shared_test_data/gromacs.mdp"),
+              "md_cmd": f"{GMX_CMD} mdrun -nt 2",
+              "grompp_cmd": f"{GMX_CMD} grompp",
+              "plumed_file": TEST_PLUMED,
+              "delta_t": 100,
+              "should_pin": False}
+
+
+def _load_results(path: str) -> list[ShootingResult]:
+    """Load expected ShootingResults saved by `_save_results`.
+
+    Parameters
+    ----------
+    path
+        Path of the .npz file
+
+    Returns
+    -------
+    The saved ShootingResults, in order
+    """
+    with np.load(path) as saved:
+        fwd_frames = saved["fwd_frames"]
+        rev_frames = saved["rev_frames"]
+        fwd_commit = saved["fwd_commit"].tolist()
+        rev_commit = saved["rev_commit"].tolist()
+
+    return [ShootingResult({"commit": fwd_commit[i], "frames": fwd_frames[i]},
+                           {"commit": rev_commit[i], "frames": rev_frames[i]})
+            for i in range(len(fwd_commit))]
+
+
+def _save_results(path: str, results: list[ShootingResult]) -> None:
+    """Save ShootingResults as stacked frame and commit arrays in a .npz
+
+    Parameters
+    ----------
+    path
+        Path of the .npz file to write
+    results
+        ShootingResults to save. All must have committed.
+    """
+    np.savez(path,
+             fwd_frames=np.stack([r.fwd["frames"] for r in results]),
+             rev_frames=np.stack([r.rev["frames"] for r in results]),
+             fwd_commit=np.array([r.fwd["commit"] for r in results]),
+             rev_commit=np.array([r.rev["commit"] for r in results]))
+
+
+async def _run_all(engine: AbstractEngine, starting_pos: np.ndarray,
+                   starting_vels: np.ndarray, n_tests: int,
+                   md_threads: int) -> list[ShootingResult]:
+    """Run every starting configuration concurrently.
+
+    Each shooting point gets its own copy of `engine`, since setting positions
+    and velocities modifies it. Trajectories get unique project names, so the
+    copies can share a working directory.
+
+    Parameters
+    ----------
+    engine
+        Engine to copy for each shooting point
+    starting_pos
+        Starting positions with shape (n_tests, n_atoms, 3)
+    starting_vels
+        Starting velocities with shape (n_tests, n_atoms, 3)
+    n_tests
+        Number of starting configurations to run
+    md_threads
+        Number of threads a single MD run of `engine` uses
+
+    Returns
+    -------
+    The ShootingResult of each starting configuration, in order
+    """
+    # Each shooting point runs its forward and reverse MD at once, each with
+    # md_threads threads. Only run as many points together as there are cores
+    # for all of their threads, but always at least one.
+    threads_per_shot = 2 * md_threads
+    limit = asyncio.Semaphore(max(1, (os.cpu_count() or 1) // threads_per_shot))
+
+    async def run_one(i: int) -> ShootingResult:
+        shot_engine = copy.deepcopy(engine)
+        shot_engine.set_positions(starting_pos[i])
+        shot_engine.set_velocities(starting_vels[i])
+        async with limit:
+            return await shot_engine.run_shooting_point()
+
+    return await asyncio.gather(*(run_one(i) for i in range(n_tests)))
+
+
+def _generate_fixed_starts(n_tests: int, engine: AbstractEngine, temp: float,
+                           np_rng: np.random.Generator) -> None:
     """Function for generating random starting positions and velocities.
 
     This is used to generate new test cases for the integration test.
@@ -112,22 +230,26 @@ def _generate_fixed_starts(n_tests: int, engine: AbstractEngine) -> None:
     ----------
     n_tests
         Number of starting positions/velocities to generate.
+    engine
+        Engine for the system, used for its atoms
+    temp
+        Temperature in Kelvin to generate velocities at
+    np_rng
+        Numpy random generator to draw positions and velocities from
     """
-    positions = np.zeros((3, 3, n_tests))
-    velocities = np.zeros((3, 3, n_tests))
+    positions = np.zeros((n_tests, 3, 3))
     # First atom (Cl-) is fixed at (0, 0, 0)
 
     # Second atom (Ca2+) is randomly generated about the middle of the two fixed
     # atoms. Centered at (5, 5, 5) angstroms with sigma=0.5
-    positions[1, :, :] = np.random.normal(5, 0.5, (3, n_tests))
+    positions[:, 1, :] = np_rng.normal(5, 0.5, (n_tests, 3))
 
     # Third atom (Cl-) is fixed at (10, 10, 10)
-    positions[2, :, :] += 10
+    positions[:, 2, :] += 10
 
     # Starting velocities for all atoms. Technically this only applies to atom 2
     # because atoms 1 and 3 are fixed and will not move.
-    for i in range(n_tests):
-        velocities[:, :, i] = generate_velocities(engine.atoms, engine.temp)
+    velocities = generate_velocities_batch(engine.atoms, temp, n_tests, np_rng)
 
     # Save these to be loaded for the test
     np.save(os.path.join(CUR_DIR, "test_data/starting_pos.npy"), positions)
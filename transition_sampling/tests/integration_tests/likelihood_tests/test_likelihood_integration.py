@@ -5,9 +5,6 @@ from itertools import combinations
 from unittest import TestCase
 
 import numpy as np
-import pandas as pd
-import scipy.optimize
-import scipy.stats
 
 from transition_sampling.likelihood.optimization import obj_func, optimize
 from transition_sampling.likelihood import Maximizer
@@ -105,23 +102,24 @@ class TestMaximizer(TestCase):
     @staticmethod
     def _replicate_plumed(colvars, file_path):
         """Writes CVs in the same way that plumed to a colvars  file"""
-        df = pd.DataFrame(colvars)
-        df.index = df.index.astype('float32')
-
         with open(file_path, "a") as f:
             # Plumed's weird header field
             f.write("#! FIELDS time ")
-            f.write(" ".join([str(name) for name in df.columns]))
+            f.write(" ".join([str(name) for name in range(colvars.shape[1])]))
             f.write("\n")
 
-            df.to_csv(f, header=False, sep=' ')
+            # One float time per row, then the shortest repr of each CV so
+            # they read back the same as before
+            f.write("".join(f"{float(i)} {' '.join(map(repr, row))}\n"
+                            for i, row in enumerate(colvars.tolist())))
 
     @staticmethod
     def _replicate_metadata(is_accepted, file_path):
         """Write is_accepted to a similar CSV"""
-        df = pd.DataFrame(is_accepted)
-        df.columns = ["accepted"]
-        df.to_csv(file_path, header=True, index_label="index")
+        with open(file_path, "w") as f:
+            f.write("index,accepted\n")
+            f.write("".join(f"{i},{accepted}\n"
+                            for i, accepted in enumerate(is_accepted.tolist())))
 
 
 def _generate_test(n_states: int, m_colvars: int, num_significant: int,
@@ -177,16 +175,13 @@ def _generate_test(n_states: int, m_colvars: int, num_significant: int,
     distances = (np.dot(cvs[:, used_cvs],
                         surf_vector) + surf_offset) / surf_norm
 
-    max_val = scipy.stats.norm.pdf(0, 0, std)
-
-    # Make the centered location have a probability of 1
-    # not a true PDF!
-    probs = scipy.stats.norm.pdf(distances, 0, std) / max_val
+    # Gaussian in the distance, scaled so the centered location has a
+    # probability of 1. Not a true PDF!
+    probs = np.exp(-0.5 * (distances / std) ** 2)
 
-    # Randomly accept or reject a state based on its distance's prob.
-    is_accepted = np.array(
-        [np.random.choice([True, False], 1, p=[prob, 1 - prob]) for prob
-         in probs]).reshape(-1)
+    # Randomly accept or reject a state based on its distance's prob, all in
+    # one draw.
+    is_accepted = np.random.random_sample(n_states) < probs
 
     # Both the constant offset and vector need to be normalized by the
     # distance of the vector to compare to a solution
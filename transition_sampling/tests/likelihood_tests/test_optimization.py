@@ -37,14 +37,19 @@ class TestObjectiveFunction(TestCase):
 
     def test_obj_func_works(self):
         """Test objective function with different shapes of inputs"""
-        np.random.seed(1)
+        rng = np.random.default_rng(1)
+
+        # Draw the largest inputs once and take a differently shaped slice of
+        # them for each case
+        colvars_buf = rng.random((10000, 10))
+        is_accepted_buf = rng.random(10000) < 0.5
 
         for i in range(30):
-            n_states = np.random.choice(10000)
-            m_colvars = np.random.choice(10)
-            colvars = np.random.random((n_states, m_colvars))
-            is_accepted = np.random.choice([True, False], n_states)
-            point = np.array(np.random.random(m_colvars + 2))
+            n_states = rng.integers(10000)
+            m_colvars = rng.integers(10)
+            colvars = colvars_buf[:n_states, :m_colvars]
+            is_accepted = is_accepted_buf[:n_states]
+            point = rng.random(m_colvars + 2)
 
             try:
                 obj_func(point, colvars, is_accepted, True)
@@ -3,7 +3,8 @@ import os
 import unittest
 
 from transition_sampling.util.periodic_table import atomic_symbols_to_mass
-from transition_sampling.util.atomic_masses import ATOMIC_MASSES
+from transition_sampling.util.atomic_masses import ATOMIC_MASSES, \
+    get_atomic_mass_dict
 
 
 CUR_DIR = os.path.dirname(__file__)
@@ -19,6 +20,15 @@ class AtomicMassDictTest(unittest.TestCase):
     def test_atomic_mass_is_dict_type(self):
         self.assertIsInstance(ATOMIC_MASSES, dict)
 
+    def test_returned_dict_is_independent(self):
+        masses = get_atomic_mass_dict()
+        masses['H'] = -1.0
+        del masses['C']
+
+        fresh = get_atomic_mass_dict()
+        self.assertEqual(fresh['H'], ATOMIC_MASSES['H'])
+        self.assertIn('C', fresh)
+
     def test_keys_are_str(self):
         for key in ATOMIC_MASSES.keys():
             self.assertIsInstance(key, str)
@@ -1,28 +1,34 @@
 from __future__ import annotations
 
+import functools
 import os
 
+_ATOMIC_INFO_FILE = os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                 '..', '..', 'data', 'atomic_info.dat')
+
+
+@functools.lru_cache(maxsize=None)
+def _read_atomic_masses() -> dict[str, float]:
+    """Parse the atomic info file once. The cached dict is shared, so it must
+    never be handed out directly."""
+    with open(_ATOMIC_INFO_FILE) as f:
+        rows = [line.split() for line in f.read().splitlines()]
+
+    # Accounts for atoms that only have a most-stable mass,
+    # e.g., Oxygen 15.9994 vs Technetium (98)
+    return {data[1]: float(data[-1].strip('()')) for data in rows if data}
+
 
 def get_atomic_mass_dict() -> dict[str, float]:
     """Builds a dictionary of atomic symbols as keys and masses as values.
 
+    The data file is only read and parsed on the first call. Every call returns
+    a new copy, so callers may modify it freely.
+
     Returns
     -------
     Dict of atomic symbols and masses"""
-    atomic_mass_dict = {}
-    dir_path = os.path.dirname(os.path.realpath(__file__))
-    with open(os.path.join(dir_path, '..', '..', 'data',
-                           'atomic_info.dat')) as f:
-        for line in f:
-            data = line.split()
-
-            # Accounts for atoms that only have a most-stable mass,
-            # e.g., Oxygen 15.9994 vs Technetium (98)
-            if data[-1].startswith('('):
-                data[-1] = data[-1][1:-1]
-
-            atomic_mass_dict[data[1]] = float(data[-1])
-    return atomic_mass_dict
+    return dict(_read_atomic_masses())
 
 
 ATOMIC_MASSES = get_atomic_mass_dict()
@@ -1,6 +1,7 @@
 """Submodule that handles the generation of periodic table information."""
 from __future__ import annotations
 
+import operator
 import typing
 
 from .atomic_masses import ATOMIC_MASSES
@@ -17,5 +18,9 @@ def atomic_symbols_to_mass(atoms: typing.Sequence[str]) -> list[float]:
     Returns
     -------
     List of atomic masses"""
-    masses = [ATOMIC_MASSES[atom] for atom in atoms]
-    return masses
+    # itemgetter does every lookup in one call, but returns a bare value
+    # rather than a tuple when given a single key
+    if len(atoms) < 2:
+        return [ATOMIC_MASSES[atom] for atom in atoms]
+
+    return list(operator.itemgetter(*atoms)(ATOMIC_MASSES))
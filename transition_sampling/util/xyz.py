@@ -1,7 +1,9 @@
 """Utilities for parsing xyz files"""
 from __future__ import annotations
 
+import itertools
 import typing
+
 import numpy as np
 
 
@@ -28,12 +30,15 @@ def read_xyz_frame(ifile: typing.IO) -> typing.Union[tuple[None, bool],
         eof = True
         return xyz, eof
 
-    xyz = np.zeros((n_atoms, 3))
     # skip comment line
-    next(ifile)
-    for i in range(n_atoms):
-        line = ifile.readline().split()
-        xyz[i] = [float(x) for x in line[1:4]]
+    ifile.readline()
+    if n_atoms:
+        # Parse the next n_atoms lines in one call, leaving the file positioned
+        # at the start of the next frame
+        xyz = np.loadtxt(itertools.islice(ifile, n_atoms), usecols=(1, 2, 3),
+                         ndmin=2)
+    else:
+        xyz = np.zeros((0, 3))
     eof = False
     return xyz, eof
 
@@ -52,21 +57,23 @@ def read_xyz_file(filename: str) -> np.ndarray:
         3d array of (n_frames, n_atoms, xyz)
     """
     with open(filename, 'r') as file:
-        _xyz, eof = read_xyz_frame(file)
-        if eof:
+        n_atoms = file.readline()
+        if not n_atoms:
             raise ValueError("File at '{}' is empty.".format(filename))
-        else:
-            pass
-        # initially store each set of xyz coords in a list
-        # and then join them all together at the end
-        xyz_list = [np.array(_xyz)]
-        eof = False
-        while not eof:
-            _xyz, eof = read_xyz_frame(file)
-            if not eof:
-                xyz_list.append(_xyz)
-
-    xyz = np.array(xyz_list)
+        n_atoms = int(n_atoms)
+
+        # Count the lines first so the output is allocated once and filled
+        # frame by frame, rather than stacking a list of frames at the end
+        n_frames, remainder = divmod(1 + sum(1 for _ in file), n_atoms + 2)
+        if remainder:
+            raise ValueError(f"File at '{filename}' does not contain a whole"
+                             f" number of {n_atoms} atom frames.")
+
+        xyz = np.empty((n_frames, n_atoms, 3))
+        file.seek(0)
+        for i in range(n_frames):
+            xyz[i], _ = read_xyz_frame(file)
+
     return xyz
 
 
@@ -96,11 +103,8 @@ def write_xyz_frame(file: typing.IO, atoms: typing.Sequence[str],
         raise ValueError(f"Number of atoms ({len(atoms)}) did not match"
                          f" the number of coordinates ({frame.shape[0]})")
 
-    file.write(f"{len(atoms)}\n")
-    file.write(f"{comment}\n")
-
-    for i in range(len(atoms)):
-        file.write(f"{atoms[i]} ")
-
-        file.write(' '.join([str(x) for x in frame[i, :]]))
-        file.write("\n")
+    # Build the whole frame and write it at once. Converting with tolist()
+    # gives python floats, whose str() matches numpy's float64 str()
+    lines = [f"{atom} {' '.join(map(str, coords))}\n"
+             for atom, coords in zip(atoms, frame.tolist())]
+    file.write(f"{len(atoms)}\n{comment}\n{''.join(lines)}")